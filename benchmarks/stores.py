@@ -0,0 +1,34 @@
+"""
+Time loading a codex's stores and deserializing every record.
+
+Run with ``nox -s bench`` or ``python benchmarks/stores.py [codex]``.
+"""
+
+import sys
+import time
+import timeit
+import warnings
+
+from warhammer._io import store
+
+NUMBER = 200
+
+
+def load(store_name):
+    stores = store.stores(store_name)
+    for store_ in (stores.effects, stores.models, stores.weapons):
+        for name in list(store_):
+            store_[name]
+
+
+def main(store_name="chaos.csm"):
+    warnings.simplefilter("ignore")
+    start = time.perf_counter()
+    load(store_name)
+    cold = time.perf_counter() - start
+    warm = timeit.timeit(lambda: load(store_name), number=NUMBER) / NUMBER
+    print(f"cold {cold * 1e3:.2f} ms, warm {warm * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -7,7 +7,7 @@ import nox
 @nox.session(python=["3.7", "3.8"])
 def coverage(session):
     session.install("coverage>=5.0.0")
-    session.install("-e", ".")
+    session.install("-e", ".[numpy]")
     session.install("pytest", "pytest-cov")
     session.run(
         "pytest",
@@ -36,7 +36,14 @@ def coverage_erase(session):
     session.run("coverage", "erase")
 
 
+@nox.session(python="3.8")
+def bench(session):
+    session.install("-e", ".")
+    session.run("python", "benchmarks/stores.py", *session.posargs)
+
+
 FILES = [
+    "benchmarks",
     "src",
     "tests",
     "noxfile.py",
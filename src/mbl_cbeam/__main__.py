@@ -2,6 +2,8 @@ import matplotlib.pyplot as plt
 import mpl_toolkits.mplot3d
 from dice_stats import Dice, Range, display
 
+from warhammer.tables import wound_skill as wound
+
 
 def dice_up(dice, number, callback):
     return dice.apply_functions(
@@ -39,18 +41,6 @@ def misses_leadership(hit, wound, save, damage, wound_dice=3):
     )
 
 
-def wound(strength, toughness):
-    if strength >= 2 * toughness:
-        return 2
-    if strength > toughness:
-        return 3
-    if strength == toughness:
-        return 4
-    if 2 * strength <= toughness:
-        return 6
-    return 5
-
-
 TOUGHNESS_LIMIT = 9
 
 
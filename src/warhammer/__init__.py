@@ -1,2 +1,4 @@
+from ._io.compiled import compile_codex
+from ._io.csv_import import import_weapons
 from ._io.data_loader import WarhammerData
 from ._io.store import stores
@@ -0,0 +1,59 @@
+"""Columnar views of the numeric fields in a store, requires ``numpy``."""
+
+from __future__ import annotations
+
+import typing
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+
+import numpy as np
+
+from .. import dice
+
+if TYPE_CHECKING:
+    from .store import Store
+
+
+def numeric_fields(model: Type[Any]) -> Dict[str, np.dtype]:
+    """
+    The ``int`` fields of a dataclass and the dtype to store them as.
+
+    ``Optional[int]`` fields are stored as floats, with ``None`` as NaN.
+    Dice fields are stored as their mean.
+    """
+    fields = {}
+    for name, type_ in typing.get_type_hints(model).items():
+        if type_ is int:
+            fields[name] = np.dtype(np.int64)
+        elif type_ == Optional[int] or type_ == dice.Value:
+            fields[name] = np.dtype(np.float64)
+    return fields
+
+
+def _number(value: Any) -> Any:
+    if value is None:
+        return np.nan
+    if isinstance(value, str):
+        value = dice.Roll.parse(value)
+    if isinstance(value, dice.Roll):
+        return float(dice.mean(value))
+    return value
+
+
+def build(store: Store[Any]) -> np.ndarray:
+    """
+    Build a structured array with a ``name`` column and a column per stat.
+
+    Values are read from the raw records, so nothing is deserialized.
+    """
+    fields = numeric_fields(store.Model)
+    names = list(store)
+    dtype = [("name", f"U{max(map(len, names), default=1)}")]
+    dtype += fields.items()
+    return np.array(
+        [
+            (name,)
+            + tuple(_number(store.field(name, field)) for field in fields)
+            for name in names
+        ],
+        dtype=dtype,
+    )
@@ -0,0 +1,213 @@
+"""
+Packed binary form of a codex's ``data/<codex>/*.json`` files.
+
+Every store is a table of fixed-width 32 bit columns, one per JSON key.
+Integers are stored inline, strings as indexes into a table of interned
+strings shared by the whole file, and anything else as interned JSON
+text. Files are memory-mapped and rows are only decoded when asked for.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import pathlib
+import struct
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import json_stream
+
+_PATH = pathlib.Path(__file__).parent.parent
+FILE_NAME = "codex.bin"
+TYPES = ("effects", "units", "weapons")
+MAGIC = b"WHC\x01"
+_HEADER = struct.Struct("<4sI")
+
+INT_MISSING = -(2 ** 31)
+INT_NONE = INT_MISSING + 1
+STR_MISSING = 2 ** 32 - 1
+STR_NONE = STR_MISSING - 1
+_MISSING = object()
+
+INTEGER = "i"
+STRING = "s"
+JSON = "j"
+_FORMATS = {INTEGER: "i", STRING: "I", JSON: "I"}
+
+
+def codex_path(store_name: str) -> pathlib.Path:
+    return _PATH / "data" / store_name / FILE_NAME
+
+
+def json_paths(store_name: str) -> List[pathlib.Path]:
+    return [json_stream.path(_PATH / "data" / store_name, type_) for type_ in TYPES]
+
+
+def _kind(values: List[Any]) -> str:
+    values = [value for value in values if value is not _MISSING and value is not None]
+    if all(type(value) is int and INT_NONE < value < 2 ** 31 for value in values):
+        return INTEGER
+    if all(isinstance(value, str) for value in values):
+        return STRING
+    return JSON
+
+
+class _Strings:
+    def __init__(self) -> None:
+        self.indexes: Dict[str, int] = {}
+
+    def __call__(self, value: str) -> int:
+        return self.indexes.setdefault(value, len(self.indexes))
+
+
+def _cell(kind: str, value: Any, strings: _Strings) -> int:
+    if kind == INTEGER:
+        if value is _MISSING:
+            return INT_MISSING
+        return INT_NONE if value is None else value
+    if value is _MISSING:
+        return STR_MISSING
+    if value is None:
+        return STR_NONE
+    return strings(value if kind == STRING else json.dumps(value))
+
+
+def _pad(data: bytearray) -> int:
+    data.extend(b"\0" * (-len(data) % 4))
+    return len(data)
+
+
+def dumps(tables: Dict[str, List[Dict[str, Any]]]) -> bytes:
+    """Pack the records of each table into the binary format."""
+    strings = _Strings()
+    header: Dict[str, Any] = {"tables": {}}
+    columns: List[Tuple[List[Any], str, List[int]]] = []
+    for name, records in tables.items():
+        keys = list(dict.fromkeys(key for record in records for key in record))
+        table = header["tables"][name] = {"rows": len(records), "columns": []}
+        for key in keys:
+            values = [record.get(key, _MISSING) for record in records]
+            kind = _kind(values)
+            column = [key, kind, 0]
+            table["columns"].append(column)
+            cells = [_cell(kind, value, strings) for value in values]
+            columns.append((column, kind, cells))
+
+    body = bytearray()
+    for column, kind, cells in columns:
+        column[2] = _pad(body)
+        body.extend(struct.pack(f"<{len(cells)}{_FORMATS[kind]}", *cells))
+    encoded = [value.encode("utf-8") for value in strings.indexes]
+    offsets = [0]
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+    header["strings"] = [_pad(body), len(encoded)]
+    body.extend(struct.pack(f"<{len(offsets)}I", *offsets))
+    body.extend(b"".join(encoded))
+
+    raw_header = bytearray(json.dumps(header).encode("utf-8"))
+    # Pad with whitespace, so the header is still valid JSON.
+    raw_header.extend(b" " * (-len(raw_header) % 4))
+    return _HEADER.pack(MAGIC, len(raw_header)) + bytes(raw_header) + bytes(body)
+
+
+class Table(Sequence[Dict[str, Any]]):
+    """Lazily decoded records of one store."""
+
+    def __init__(self, codex: Codex, rows: int, columns: List[List[Any]]) -> None:
+        self._codex = codex
+        self._rows = rows
+        self._columns = [
+            (key, kind, codex.column(offset, rows, _FORMATS[kind]))
+            for key, kind, offset in columns
+        ]
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __getitem__(self, row: int) -> Dict[str, Any]:
+        if not 0 <= row < self._rows:
+            raise IndexError(row)
+        record = {}
+        for key, kind, column in self._columns:
+            cell = column[row]
+            if kind == INTEGER:
+                if cell != INT_MISSING:
+                    record[key] = None if cell == INT_NONE else cell
+            elif cell != STR_MISSING:
+                if cell == STR_NONE:
+                    record[key] = None
+                elif kind == STRING:
+                    record[key] = self._codex.string(cell)
+                else:
+                    record[key] = json.loads(self._codex.string(cell))
+        return record
+
+    def names(self) -> Iterator[str]:
+        """Names of every record, without decoding the rest of the rows."""
+        for key, _, column in self._columns:
+            if key == "name":
+                return map(self._codex.string, column)
+        raise KeyError("name")
+
+
+class Codex:
+    """A memory-mapped compiled codex."""
+
+    tables: Dict[str, Table]
+
+    def __init__(self, path: pathlib.Path) -> None:
+        with path.open("rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, size = _HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{path} isn't a compiled codex.")
+        self._base = _HEADER.size + size
+        header = json.loads(bytes(self._map[_HEADER.size : self._base]))
+        offset, count = header["strings"]
+        self._offsets = self.column(offset, count + 1, "I")
+        self._strings_base = self._base + offset + 4 * (count + 1)
+        self._strings: Dict[int, str] = {}
+        self.tables = {
+            name: Table(self, table["rows"], table["columns"])
+            for name, table in header["tables"].items()
+        }
+
+    def column(self, offset: int, rows: int, format_: str) -> memoryview:
+        start = self._base + offset
+        return memoryview(self._map)[start : start + 4 * rows].cast(format_)
+
+    def string(self, index: int) -> str:
+        try:
+            return self._strings[index]
+        except KeyError:
+            start = self._strings_base + self._offsets[index]
+            end = self._strings_base + self._offsets[index + 1]
+            value = self._strings[index] = self._map[start:end].decode("utf-8")
+            return value
+
+
+def compile_codex(
+    store_name: str, path: Optional[pathlib.Path] = None
+) -> pathlib.Path:
+    """Compile ``data/<store_name>/*.json`` into one binary file."""
+    tables = {}
+    for type_, json_path in zip(TYPES, json_paths(store_name)):
+        tables[type_] = json_stream.read(json_path)
+    path = codex_path(store_name) if path is None else path
+    data = dumps(tables)
+    # Open codexes keep mapping the old file, rather than a truncated one.
+    json_stream.replace(path, lambda f: f.write(data), "wb")
+    return path
+
+
+def open_codex(store_name: str) -> Optional[Codex]:
+    """Open the compiled codex, if it exists and is newer than the JSON."""
+    path = codex_path(store_name)
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if any(json_path.stat().st_mtime > mtime for json_path in json_paths(store_name)):
+        return None
+    return Codex(path)
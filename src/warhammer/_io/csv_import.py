@@ -0,0 +1,83 @@
+"""Import weapon profiles from CSV, ``name,range,type,A,S,AP,D,notes`` rows."""
+
+from __future__ import annotations
+
+import csv
+import functools
+import pathlib
+from typing import Iterable, List, Tuple
+
+from .. import dice, models
+from .store import Store
+
+COLUMNS = 8
+_TYPES = {type_.value.casefold(): type_ for type_ in models.WeaponType}
+
+
+@functools.lru_cache(maxsize=None)
+def _weapon_type(text: str) -> models.WeaponType:
+    return _TYPES[text.strip().casefold()]
+
+
+@functools.lru_cache(maxsize=None)
+def _value(text: str) -> dice.Value:
+    """Parse a stat once, so equal dice expressions share a :class:`dice.Roll`."""
+    text = text.strip()
+    if text.lstrip("+-").isdigit():
+        return int(text)
+    return dice.Roll.parse(text)
+
+
+def _weapon(row: List[str]) -> models.Weapon:
+    name, range_, type_, attacks, strength, armour_penetration, damage, _ = row
+    return models.Weapon(
+        name.strip(),
+        int(range_),
+        _weapon_type(type_),
+        _value(attacks),
+        int(strength),
+        # AP is stored as is, negative AP makes the save worse.
+        int(armour_penetration),
+        _value(damage),
+        (),
+    )
+
+
+def parse_weapons(
+    rows: Iterable[List[str]],
+) -> Tuple[List[models.Weapon], List[str]]:
+    """
+    Parse the rows in one pass.
+
+    Returns the weapons and the names of rows with missing or unknown stats.
+    """
+    weapons = []
+    skipped = []
+    for row in rows:
+        row = (row + [""] * COLUMNS)[:COLUMNS]
+        if not any(cell.strip() for cell in row):
+            continue
+        try:
+            weapons.append(_weapon(row))
+        except (KeyError, ValueError):
+            skipped.append(row[0])
+    return weapons, skipped
+
+
+def read_weapons(path: pathlib.Path) -> Tuple[List[models.Weapon], List[str]]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return parse_weapons(csv.reader(f))
+
+
+def import_weapons(path: pathlib.Path, store: Store[models.Weapon]) -> List[str]:
+    """
+    Add every weapon in the CSV at ``path`` to ``store``.
+
+    Existing weapons with the same name are replaced. Call ``store.save()``,
+    and then :func:`warhammer.compile_codex`, to persist them. Returns the
+    names of rows that were skipped.
+    """
+    weapons, skipped = read_weapons(path)
+    for weapon in weapons:
+        store[weapon.name] = weapon
+    return skipped
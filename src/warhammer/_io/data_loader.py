@@ -1,10 +1,19 @@
 from __future__ import annotations
 
-from typing import Type
+from typing import Type, TypeVar
 
 from .. import models, unit
 from . import store
 
+T = TypeVar("T")
+
+
+def _get(store_: store.Store[T], item: str) -> T:
+    """Get by exact name, falling back to ignoring case."""
+    if item not in store_:
+        item = store_.index.get(item) or item
+    return store_[item]
+
 
 class Effects:
     stores: store.StoreCollection
@@ -13,7 +22,11 @@ class Effects:
         self.stores = stores
 
     def __getattr__(self, item: str) -> Type[models.Effect]:
-        return self.stores.effects.get_effect(item)
+        effects = self.stores.effects
+        name = item if item in effects else effects.index.get(item) or item
+        effect = effects.get_effect(name)
+        setattr(self, item, effect)
+        return effect
 
 
 class Weapons:
@@ -23,7 +36,7 @@ class Weapons:
         self.stores = stores
 
     def __getattr__(self, item) -> models.WeaponAmount:
-        return models.WeaponAmount.from_item(self.stores.weapons[item])
+        return models.WeaponAmount.from_item(_get(self.stores.weapons, item))
 
 
 class Models:
@@ -33,7 +46,7 @@ class Models:
         self.stores = stores
 
     def __getattr__(self, item) -> unit.Unit:
-        return unit.Unit.from_item(self.stores.models[item])
+        return unit.Unit.from_item(_get(self.stores.models, item))
 
 
 class WarhammerData:
@@ -43,7 +56,7 @@ class WarhammerData:
     model: Models
 
     def __init__(self, source: str):
-        self.stores = stores = store.stores(source)
+        self.stores = stores = store.cached_stores(source)
         self.effect = Effects(stores)
         self.weapon = Weapons(stores)
         self.model = Models(stores)
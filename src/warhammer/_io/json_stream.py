@@ -0,0 +1,154 @@
+"""
+Read and write store files a record at a time.
+
+Stores are either a JSON array, ``<type>.json``, or JSON lines,
+``<type>.jsonl``, with one record per line.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import re
+import shutil
+import tempfile
+from typing import IO, Any, Callable, Iterable, Iterator, List, TextIO
+
+CHUNK_SIZE = 2 ** 16
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_START = 0
+_FIRST = 1
+_VALUE = 2
+_SEPARATOR = 3
+
+
+def path(directory: pathlib.Path, type_: str) -> pathlib.Path:
+    """The store file, preferring JSON lines when both exist."""
+    lines = directory / f"{type_}.jsonl"
+    return lines if lines.exists() else directory / f"{type_}.json"
+
+
+def _terminated(buffer: str, end: int) -> bool:
+    index = _WHITESPACE.match(buffer, end).end()
+    return index < len(buffer) and buffer[index] in ",]"
+
+
+def iter_array(f: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array, reading ``chunk_size`` at a time."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    index = 0
+    state = _START
+    while True:
+        index = _WHITESPACE.match(buffer, index).end()
+        if index == len(buffer):
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise ValueError("Unexpected end of JSON array.")
+            buffer = buffer[index:] + chunk
+            index = 0
+            continue
+        char = buffer[index]
+        if state == _START:
+            if char != "[":
+                raise ValueError("Expected a JSON array.")
+            index += 1
+            state = _FIRST
+        elif state in (_FIRST, _SEPARATOR) and char == "]":
+            return
+        elif state == _SEPARATOR:
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' not {char!r}.")
+            index += 1
+            state = _VALUE
+        else:
+            try:
+                value, end = decoder.raw_decode(buffer, index)
+            except json.JSONDecodeError:
+                value, end = None, None
+            # Items, such as numbers, may continue into the next chunk.
+            if end is None or not _terminated(buffer, end):
+                chunk = f.read(chunk_size)
+                if chunk:
+                    buffer = buffer[index:] + chunk
+                    index = 0
+                    continue
+                if end is None:
+                    raise ValueError("Invalid item in JSON array.")
+            yield value
+            index = end
+            state = _SEPARATOR
+
+
+def iter_lines(f: TextIO) -> Iterator[Any]:
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+
+def iter_records(path_: pathlib.Path) -> Iterator[Any]:
+    with path_.open() as f:
+        if path_.suffix == ".jsonl":
+            yield from iter_lines(f)
+        else:
+            yield from iter_array(f)
+
+
+def read(path_: pathlib.Path) -> List[Any]:
+    with path_.open() as f:
+        if path_.suffix == ".jsonl":
+            return list(iter_lines(f))
+        return json.load(f)
+
+
+def _umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _fsync_directory(directory: pathlib.Path) -> None:
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def replace(
+    path_: pathlib.Path, write_: Callable[[IO[Any]], None], mode: str = "w"
+) -> None:
+    """Write to a temporary file and rename it, so ``path_`` is never partial."""
+    with tempfile.NamedTemporaryFile(
+        mode, dir=path_.parent, prefix=f".{path_.name}.", delete=False
+    ) as f:
+        try:
+            write_(f)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    # NamedTemporaryFile is only readable by its owner.
+    if path_.exists():
+        shutil.copymode(path_, f.name)
+    else:
+        os.chmod(f.name, 0o666 & ~_umask())
+    _fsync_directory(path_.parent)
+    os.replace(f.name, path_)
+    _fsync_directory(path_.parent)
+
+
+def write(path_: pathlib.Path, records: Iterable[Any]) -> None:
+    def write_(f: IO[Any]) -> None:
+        if path_.suffix == ".jsonl":
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        else:
+            json.dump(list(records), f)
+
+    replace(path_, write_)
@@ -0,0 +1,113 @@
+"""Name and stat indexes over the records in a store."""
+
+from __future__ import annotations
+
+import bisect
+import difflib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from .. import dice
+
+if TYPE_CHECKING:
+    from .store import Store
+
+Bounds = Tuple[Optional[Any], Optional[Any]]
+
+
+def _value(value: Any) -> Any:
+    """Compare dice by their mean, raw records store them as strings."""
+    if isinstance(value, str):
+        try:
+            value = dice.Roll.parse(value)
+        except ValueError:
+            return value
+    if isinstance(value, dice.Roll):
+        return dice.mean(value)
+    return value
+
+
+class Index:
+    """
+    Sorted indexes of a store, built once and reused for every query.
+
+    Names are matched case insensitively. Stat indexes are only built
+    for the fields that are queried.
+    """
+
+    _store: Store
+    _names: List[str]
+    _folded: List[str]
+    _fields: Dict[str, Tuple[List[Any], List[str]]]
+
+    def __init__(self, store: Store) -> None:
+        self._store = store
+        pairs = sorted((name.casefold(), name) for name in store)
+        self._folded = [folded for folded, _ in pairs]
+        self._names = [name for _, name in pairs]
+        self._fields = {}
+
+    def get(self, name: str) -> Optional[str]:
+        """Find the name of a record, ignoring case."""
+        folded = name.casefold()
+        index = bisect.bisect_left(self._folded, folded)
+        if index < len(self._folded) and self._folded[index] == folded:
+            return self._names[index]
+        return None
+
+    def prefix(self, prefix: str) -> List[str]:
+        """Names starting with ``prefix``, ignoring case."""
+        folded = prefix.casefold()
+        start = bisect.bisect_left(self._folded, folded)
+        end = start
+        while end < len(self._folded) and self._folded[end].startswith(folded):
+            end += 1
+        return self._names[start:end]
+
+    def fuzzy(self, name: str, n: int = 5, cutoff: float = 0.6) -> List[str]:
+        """The closest ``n`` names to ``name``, best first."""
+        names = dict(zip(self._folded, self._names))
+        return [
+            names[match]
+            for match in difflib.get_close_matches(
+                name.casefold(), self._folded, n, cutoff
+            )
+        ]
+
+    def _field(self, field: str) -> Tuple[List[Any], List[str]]:
+        try:
+            return self._fields[field]
+        except KeyError:
+            pairs = sorted(
+                (value, name)
+                for name in self._names
+                for value in [_value(self._store.field(name, field))]
+                if value is not None
+            )
+            index = self._fields[field] = (
+                [value for value, _ in pairs],
+                [name for _, name in pairs],
+            )
+            return index
+
+    def between(
+        self, field: str, low: Optional[Any] = None, high: Optional[Any] = None
+    ) -> Set[str]:
+        """Names where ``low <= field <= high``, either bound may be omitted."""
+        values, names = self._field(field)
+        start = 0 if low is None else bisect.bisect_left(values, low)
+        end = len(values) if high is None else bisect.bisect_right(values, high)
+        return set(names[start:end])
+
+    def query(self, **bounds: Bounds) -> List[str]:
+        """
+        Names matching every ``field=(low, high)`` bound, sorted by name.
+
+        For example ``query(toughness=(7, None), save=(None, 3))``.
+        """
+        matches: Optional[Set[str]] = None
+        for field, (low, high) in bounds.items():
+            names = self.between(field, low, high)
+            matches = names if matches is None else matches & names
+        if matches is None:
+            return list(self._names)
+        return [name for name in self._names if name in matches]
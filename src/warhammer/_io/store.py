@@ -1,53 +1,243 @@
 from __future__ import annotations
 
-import json
+import functools
 import pathlib
-from typing import Any, Dict, Generic, Iterator, Type, TypeVar
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 import marshmallow
 import mm_json as typing_json
 
-from .. import models
+from .. import dice, models
+from . import compiled, json_stream, search
 from .effects_store import EffectsStore
 
+if TYPE_CHECKING:
+    import numpy as np
+
 _PATH = pathlib.Path(__file__).parent.parent
 T = TypeVar("T")
+_UNLOADED = object()
+Signature = Tuple[Tuple[str, int, int], ...]
+
+
+class EffectField(marshmallow.fields.Field):
+    def _serialize(self, value, attr, obj, **kwargs):
+        return value.name
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        return self.context["effects"].get_effect(value)
+
+    @classmethod
+    def from_typing(cls, _converter, _arguments, **kwargs):
+        return cls(**kwargs)
+
+
+class WeaponAmountField(marshmallow.fields.Field):
+    def _serialize(self, value, attr, obj, **kwargs):
+        return [
+            {"model": model.name, "amount": amount,}
+            for model, amount in value.iter_amount()
+        ]
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        weapons_store = self.context["weapons"]
+        return models.WeaponAmount(
+            {weapons_store[item["model"]]: item["amount"] for item in value}
+        )
+
+    @classmethod
+    def from_typing(
+        cls,
+        _converter: typing_json.Converter,
+        _arguments: Iterator[marshmallow.fields.Field],
+        **kwargs: Any,
+    ):
+        return cls(**kwargs)
+
+
+class RollField(marshmallow.fields.Field):
+    def _serialize(self, value, attr, obj, **kwargs):
+        return str(value)
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        try:
+            return dice.Roll.parse(value)
+        except (TypeError, ValueError) as error:
+            raise marshmallow.ValidationError(str(error)) from None
+
+    @classmethod
+    def from_typing(cls, _converter, _arguments, **kwargs):
+        return cls(**kwargs)
+
+
+CONVERTER = typing_json.Converter(
+    {
+        models.Effect: EffectField,
+        models.WeaponAmount: WeaponAmountField,
+        dice.Roll: RollField,
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def schema_class(model: Type[T]) -> Type[marshmallow.Schema]:
+    """Build the schema for ``model`` once, codexes pass their stores by context."""
+    return type(typing_json.dataclass_json(model, converter=CONVERTER).schema)
 
 
 class Store(Generic[T]):
     path: pathlib.Path
     Model: Type[T]
-    _data: Dict[str, T]
+    schema: marshmallow.Schema
+    _data: Dict[str, Any]
+    _records: Sequence[Any]
+    _index: Dict[str, int]
+    _dirty: Set[str]
+    _search: Optional[search.Index]
+    _columns: Optional[np.ndarray]
 
-    def __init__(
-        self, name: str, type_: str, model: Type[T], converter: typing_json.Converter
-    ) -> None:
-        self.path = _PATH / "data" / name / f"{type_}.json"
-        self.Model = typing_json.dataclass_json(model, converter=converter)
+    def __init__(self, name: str, type_: str, model: Type[T]) -> None:
+        self.path = json_stream.path(_PATH / "data" / name, type_)
+        self.Model = model
+        self.schema = schema_class(model)()
         self._data = {}
+        self._records = ()
+        self._index = {}
+        self._dirty = set()
+        self._search = None
+        self._columns = None
 
     def __getitem__(self, item: str) -> T:
-        return self._data[item]
+        value = self._data[item]
+        if value is _UNLOADED:
+            value = self.schema.load(self._records[self._index[item]])
+            self._set(item, value)
+        return value
 
-    def __setitem__(self, item: str, value: T) -> None:
+    def _set(self, item: str, value: T) -> None:
         self._data[item] = value
 
+    def __setitem__(self, item: str, value: T) -> None:
+        self._set(item, value)
+        self._index.pop(item, None)
+        self._dirty.add(item)
+        self._changed()
+
     def __delitem__(self, item: str) -> None:
         del self._data[item]
+        self._index.pop(item, None)
+        self._dirty.add(item)
+        self._changed()
+
+    def _changed(self) -> None:
+        self._search = None
+        self._columns = None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._data
+
+    def field(self, item: str, field: str) -> Any:
+        """
+        Get a field of a record as it's stored in JSON.
+
+        Records that have been set are serialized, so every record's
+        fields compare alike.
+        """
+        if item in self._index:
+            return self._records[self._index[item]].get(field)
+        return self.schema.dump(self[item]).get(field)
+
+    @property
+    def index(self) -> search.Index:
+        if self._search is None:
+            self._search = search.Index(self)
+        return self._search
+
+    @property
+    def columns(self) -> np.ndarray:
+        """
+        The numeric fields of every record as a structured array, requires ``numpy``.
+
+        For example ``c[(c["strength"] >= 8) & (c["armour_penetration"] <= -2)]``.
+        The array is rebuilt after records are set or deleted.
+        """
+        if self._columns is None:
+            from . import columns
+
+            self._columns = columns.build(self)
+        return self._columns
+
+    @property
+    def dirty(self) -> bool:
+        """Whether records have been set or deleted since the last save."""
+        return bool(self._dirty)
+
+    def _add_records(self, records: Sequence[Any], names: Iterable[str]) -> None:
+        self._records = records
+        for row, name in enumerate(names):
+            self._data[name] = _UNLOADED
+            self._index[name] = row
 
     @classmethod
     def load(cls, *args: Any, **kwargs: Any) -> Store[T]:
         store = cls(*args, **kwargs)
-        with store.path.open() as f:
-            for w in store.Model.schema.load(json.load(f), many=True):
-                store[w.name] = w
+        records = json_stream.read(store.path)
+        store._add_records(records, (record["name"] for record in records))
+        return store
+
+    @classmethod
+    def load_records(
+        cls, records: Sequence[Any], names: Iterable[str], *args: Any, **kwargs: Any
+    ) -> Store[T]:
+        """Build a store that only deserializes records when they're accessed."""
+        store = cls(*args, **kwargs)
+        store._add_records(records, names)
         return store
 
     def save(self) -> None:
-        raw_json = list(self._data.values())
-        items = self.Model.schema.dump(list(raw_json), many=True)
-        with self.path.open("w") as f:
-            json.dump(items, f)
+        """
+        Atomically rewrite the file.
+
+        Only records that have changed are serialized, the rest are
+        written from the raw JSON they were loaded from.
+        """
+        items = [
+            self._records[self._index[name]]
+            if name in self._index
+            else self.schema.dump(value)
+            for name, value in self._data.items()
+        ]
+        json_stream.write(self.path, items)
+        self._records = items
+        self._index = {name: row for row, name in enumerate(self._data)}
+        self._dirty.clear()
+
+    def load_stream(self) -> None:
+        """Deserialize the file a record at a time, without keeping the raw JSON."""
+        for record in json_stream.iter_records(self.path):
+            self._set(record["name"], self.schema.load(record))
+        self._changed()
 
 
 class EffectStore(Store[models.EffectJSON]):
@@ -58,10 +248,16 @@ class EffectStore(Store[models.EffectJSON]):
         self._effects_data = models.store.new_child()
 
     def get_effect(self, item: str) -> Type[models.Effect]:
+        if item in self._data:
+            self[item]
         return self._effects_data[item]
 
-    def __setitem__(self, item: str, value: models.EffectJSON) -> None:
-        super().__setitem__(item, value)
+    def _set(self, item: str, value: models.EffectJSON) -> None:
+        # Aliases of codex effects need their base loaded first.
+        if value.base in self._data and value.base != item:
+            self[value.base]
+        super()._set(item, value)
+        self._effects_data._effects.maps[0].pop(item, None)
         self._effects_data.alias(
             value.name,
             value.base,
@@ -92,46 +288,117 @@ class StoreCollection:
         self.models = models_store
         self.weapons = weapons_store
 
+    def search(self, query: str, n: int = 5) -> Dict[str, List[str]]:
+        """Names starting with ``query``, or else close to it, in every store."""
+        results = {}
+        for type_, store in (
+            ("effects", self.effects),
+            ("models", self.models),
+            ("weapons", self.weapons),
+        ):
+            results[type_] = store.index.prefix(query)[:n] or store.index.fuzzy(
+                query, n
+            )
+        return results
 
-def stores(store_name: str) -> StoreCollection:
-    class EffectField(marshmallow.fields.Field):
-        def _serialize(self, value, attr, obj, **kwargs):
-            return value.name
+    def save(self) -> None:
+        """Save the stores that have changed."""
+        for store in (self.effects, self.models, self.weapons):
+            if store.dirty:
+                store.save()
 
-        def _deserialize(self, value, attr, data, **kwargs):
-            return effects_store.get_effect(value)
 
-        @classmethod
-        def from_typing(cls, _converter, _arguments, **kwargs):
-            return cls(**kwargs)
+Tables = Dict[str, Tuple[Sequence[Any], Tuple[str, ...]]]
 
-    class WeaponAmountField(marshmallow.fields.Field):
-        def _serialize(self, value, attr, obj, **kwargs):
-            return [
-                {"model": model.name, "amount": amount,}
-                for model, amount in value.iter_amount()
-            ]
 
-        def _deserialize(self, value, attr, data, **kwargs):
-            return models.WeaponAmount(
-                {weapons_store[item["model"]]: item["amount"] for item in value}
-            )
+def _read_tables(store_name: str) -> Tables:
+    """Each store's raw records and names, from the compiled codex if it's current."""
+    codex = compiled.open_codex(store_name)
+    if codex is not None:
+        return {
+            type_: (table, tuple(table.names()))
+            for type_, table in codex.tables.items()
+        }
+    tables = {}
+    for type_, path in zip(compiled.TYPES, compiled.json_paths(store_name)):
+        records = json_stream.read(path)
+        tables[type_] = records, tuple(record["name"] for record in records)
+    return tables
 
-        @classmethod
-        def from_typing(
-            cls,
-            _converter: typing_json.Converter,
-            _arguments: Iterator[marshmallow.fields.Field],
-            **kwargs: Any,
-        ):
-            return cls(**kwargs)
 
-    _converter = typing_json.Converter(
-        {models.Effect: EffectField, models.WeaponAmount: WeaponAmountField,}
+def _collection(
+    effects_store: EffectStore,
+    models_store: Store[models.Model],
+    weapons_store: Store[models.Weapon],
+) -> StoreCollection:
+    context = {"effects": effects_store, "weapons": weapons_store}
+    for store in (effects_store, models_store, weapons_store):
+        store.schema.context = context
+    return StoreCollection(CONVERTER, effects_store, models_store, weapons_store)
+
+
+def _from_tables(store_name: str, tables: Tables) -> StoreCollection:
+    return _collection(
+        EffectStore.load_records(
+            *tables["effects"], store_name, "effects", models.EffectJSON
+        ),
+        Store.load_records(*tables["units"], store_name, "units", models.Model),
+        Store.load_records(*tables["weapons"], store_name, "weapons", models.Weapon),
     )
-    effects_store = EffectStore.load(
-        store_name, "effects", models.EffectJSON, _converter,
+
+
+def stores(store_name: str, *, stream: bool = False) -> StoreCollection:
+    """
+    Load a codex's stores.
+
+    Records are deserialized on first access, from the compiled codex if
+    it's up to date. With ``stream`` the JSON files are instead read and
+    deserialized one record at a time, bounding memory to one raw record.
+    """
+    if not stream:
+        return _from_tables(store_name, _read_tables(store_name))
+    collection = _collection(
+        EffectStore(store_name, "effects", models.EffectJSON),
+        Store(store_name, "units", models.Model),
+        Store(store_name, "weapons", models.Weapon),
     )
-    models_store = Store.load(store_name, "units", models.Model, _converter,)
-    weapons_store = Store.load(store_name, "weapons", models.Weapon, _converter,)
-    return StoreCollection(_converter, effects_store, models_store, weapons_store,)
+    for store in (collection.effects, collection.weapons, collection.models):
+        store.load_stream()
+    return collection
+
+
+_cache: Dict[str, Tuple[Signature, Tables]] = {}
+_cache_lock = threading.Lock()
+
+
+def _signature(store_name: str) -> Signature:
+    return tuple(
+        (path.name, stat.st_mtime_ns, stat.st_size)
+        for path in sorted((_PATH / "data" / store_name).iterdir())
+        if path.is_file()
+        for stat in [path.stat()]
+    )
+
+
+def cached_stores(store_name: str) -> StoreCollection:
+    """
+    :func:`stores`, reading each codex's files once per process.
+
+    Only the raw records are shared, every call gets its own collection
+    to deserialize into and edit. The records are read again whenever a
+    file in ``data/<store_name>/`` changes.
+    """
+    signature = _signature(store_name)
+    with _cache_lock:
+        cached = _cache.get(store_name)
+    if cached is not None and cached[0] == signature:
+        return _from_tables(store_name, cached[1])
+    tables = _read_tables(store_name)
+    with _cache_lock:
+        _cache[store_name] = signature, tables
+    return _from_tables(store_name, tables)
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
@@ -1,56 +1,279 @@
 from __future__ import annotations
 
+import collections
+import contextlib
+import dataclasses
 import fractions
+import functools
 import numbers
-from typing import Tuple
+import operator
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from dice_stats import Dice as Damage
 
-from . import item_amount, models
+from . import dice, item_amount, models, stages, tables
 
 Number = numbers.Real
 Unit = item_amount.ItemAmount[models.ModelWrapper]
+Chances = Tuple[fractions.Fraction, ...]
+CACHE_SIZE = 4096
+T = TypeVar("T")
 
 
-def fnp_damage(damage, fnp):
-    return Damage.sum(
-        amount - (fnp.non_repeat * amount).as_chance(chance)
-        for amount, chance in damage.items()
-    )
+@dataclasses.dataclass(frozen=True)
+class Trace:
+    backend: Type[Attack]
+    attack: models.Attack
+    effects: Tuple[models.Effect, ...]
+    seconds: float
+
+
+@dataclasses.dataclass(frozen=True)
+class Summary:
+    mean: Number
+    variance: Number
+
+    @classmethod
+    def from_damage(cls, damage: Mapping[int, Number]) -> Summary:
+        mean = sum(value * chance for value, chance in damage.items())
+        return cls(
+            mean, sum((value - mean) ** 2 * chance for value, chance in damage.items())
+        )
+
+    def __add__(self, other: Summary) -> Summary:
+        if not isinstance(other, Summary):
+            return NotImplemented
+        return Summary(self.mean + other.mean, self.variance + other.variance)
+
+    def __mul__(self, other: int) -> Summary:
+        """Summary of ``other`` independent rolls."""
+        return Summary(self.mean * other, self.variance * other)
+
+    __rmul__ = __mul__
+
+    def repeat(self, rolls: dice.Value) -> Summary:
+        """Summary of the total of a rolled amount of independent rolls."""
+        mean = dice.mean(rolls)
+        return Summary(
+            self.mean * mean,
+            self.variance * mean + dice.variance(rolls) * self.mean ** 2,
+        )
+
+
+Tracer = Callable[[Trace], None]
+_tracers: List[Tracer] = []
+
+
+@contextlib.contextmanager
+def trace(tracer: Optional[Tracer] = None) -> Iterator[List[Trace]]:
+    """
+    Record every profile evaluated by :meth:`Attack.attack` in the block.
+
+    Records are passed to ``tracer`` if given, otherwise they're collected
+    in the yielded list.
+    """
+    traces: List[Trace] = []
+    tracer_ = traces.append if tracer is None else tracer
+    _tracers.append(tracer_)
+    try:
+        yield traces
+    finally:
+        _tracers.remove(tracer_)
+
+
+def compound(counts: Damage, damage: Damage) -> Damage:
+    """Roll ``damage`` once for every point in ``counts`` and total the rolls."""
+    return Damage.sum((damage * amount) @ chance for amount, chance in counts.items())
+
+
+def point(value: int) -> Damage:
+    return Damage({value: fractions.Fraction(1, 1)})
+
+
+NOTHING = point(0)
+
+
+def mix(outcomes: Iterable[Tuple[Damage, Number]]) -> Damage:
+    """Damage of rolling one of ``outcomes`` with the given chance."""
+    return Damage.sum(damage @ chance for damage, chance in outcomes if chance)
+
+
+def convolve_power(dist: T, k: int, add: Callable[[T, T], T] = operator.add) -> T:
+    """Sum of ``k`` independent rolls of ``dist``, by repeated squaring."""
+    if k < 1:
+        raise ValueError("Can only sum a positive amount of rolls.")
+    result = None
+    while True:
+        if k & 1:
+            result = dist if result is None else add(result, dist)
+        k >>= 1
+        if not k:
+            return result
+        dist = add(dist, dist)
 
 
 class Attack:
     def __init__(self, effects: Tuple[models.Effect, ...]):
         self.effects = effects
+        self.rules = stages.compile_effects(effects)
 
     def wound_skill(self, attack: models.Attack):
-        if attack.strength >= 2 * attack.toughness:
-            return 2
-        if attack.strength > attack.toughness:
-            return 3
-        if attack.strength == attack.toughness:
-            return 4
-        if 2 * attack.strength <= attack.toughness:
-            return 6
-        return 5
-
-    def attack(self, attack: models.Attack):
-        print(attack)
-        print(self.effects)
-        _save = min([attack.save - attack.armour_penetration, attack.invulnerable, 7,])
-
-        damages = [
-            Damage({1: fractions.Fraction(7 - attack.attack_skill, 6)}),
-            Damage({1: fractions.Fraction(7 - self.wound_skill(attack), 6)}),
-            Damage({1: fractions.Fraction(_save - 1, 6)}),
-            fnp_damage(
-                Damage({attack.damage: fractions.Fraction(1, 1)}),
-                Damage({1: fractions.Fraction(7 - attack.feel_no_pain, 6)}),
+        return tables.wound_skill(attack.strength, attack.toughness)
+
+    def chances(self, attack: models.Attack) -> Chances:
+        """Chance to hit, wound, fail the save and fail the feel no pain."""
+        return (
+            tables.hit_chance(attack.attack_skill),
+            tables.wound_chance(attack.strength, attack.toughness),
+            tables.unsaved_chance(
+                attack.save, attack.armour_penetration, attack.invulnerable
             ),
-        ]
+            tables.unsaved_chance(attack.feel_no_pain, 0, 7),
+        )
+
+    @staticmethod
+    def repeat(damage: Damage, rolls: dice.Roll) -> Damage:
+        """Total of a rolled amount of independent rolls of ``damage``."""
+        return compound(dice.roll(rolls), damage)
+
+    @staticmethod
+    def nothing() -> Damage:
+        """Damage when no weapon can attack."""
+        return NOTHING
+
+    def attack(self, attack: models.Attack) -> Damage:
+        if not _tracers:
+            return self._damage(attack)
+        start = time.perf_counter()
+        damage = self._damage(attack)
+        record = Trace(type(self), attack, self.effects, time.perf_counter() - start)
+        for tracer in _tracers:
+            tracer(record)
+        return damage
+
+    def summary(self, attack: models.Attack) -> Summary:
+        """Mean and variance of :meth:`attack`, without building the distribution."""
+        if self.rules is not None:
+            return self._rules_summary(attack)
+        hit, wound, save, feel_no_pain = self.chances(attack)
+        unsaved = hit * wound * save
+        damage = dice.mean(attack.damage) * feel_no_pain
+        spread = dice.variance(attack.damage) * feel_no_pain ** 2
+        mean = unsaved * damage
+        return Summary(
+            mean,
+            unsaved * (damage * (1 - feel_no_pain) + spread + damage ** 2) - mean ** 2,
+        )
+
+    def _damage(self, attack: models.Attack) -> Damage:
+        if self.rules is not None:
+            return self._rules_damage(attack)
+        hit, wound, save, feel_no_pain = self.chances(attack)
+        return functools.reduce(
+            compound,
+            [
+                Damage.from_partial({1: hit}),
+                Damage.from_partial({1: wound}),
+                Damage.from_partial({1: save}),
+                dice.roll(attack.damage),
+                Damage.from_partial({1: feel_no_pain}),
+            ],
+        )
+
+    def _rules_damage(self, attack: models.Attack) -> Damage:
+        """Damage with rerolls, modifiers and effects on 6s."""
+        rules = self.rules
+        save = tables.save(attack.save, attack.armour_penetration, attack.invulnerable)
+        hit = rules.hit.roll(attack.attack_skill)
+        wound = rules.wound.roll(tables.wound_skill(attack.strength, attack.toughness))
+        saved = rules.save.roll(save)
+        ignored = rules.feel_no_pain.roll(attack.feel_no_pain)
+
+        through = Damage.from_partial({1: _failed(ignored)})
+        unsaved = Damage.from_partial({1: _failed(saved)})
+        wounded = compound(unsaved, compound(dice.roll(attack.damage), through))
+        mortal = compound(point(rules.mortal_wounds), through)
+        per_hit = mix(
+            ((wounded if passed else NOTHING) + (mortal if six else NOTHING), chance)
+            for (passed, six), chance in wound.items()
+        )
+        hits: Dict[int, Number] = collections.defaultdict(int)
+        for (passed, six), chance in hit.items():
+            hits[passed + (rules.extra_hits if six else 0)] += chance
+        return compound(mix((point(n), chance) for n, chance in hits.items()), per_hit)
+
+    def _rules_summary(self, attack: models.Attack) -> Summary:
+        """:meth:`_rules_damage`'s mean and variance, from the moments of each roll."""
+        rules = self.rules
+        save = tables.save(attack.save, attack.armour_penetration, attack.invulnerable)
+        hit = rules.hit.roll(attack.attack_skill)
+        wound = rules.wound.roll(tables.wound_skill(attack.strength, attack.toughness))
+        saved = rules.save.roll(save)
+        ignored = rules.feel_no_pain.roll(attack.feel_no_pain)
+
+        through = _bernoulli(_failed(ignored))
+        damage = Summary(dice.mean(attack.damage), dice.variance(attack.damage))
+        wounded = _compound(_bernoulli(_failed(saved)), _compound(damage, through))
+        mortal = _compound(Summary(rules.mortal_wounds, 0), through)
+        nothing = Summary(0, 0)
+        per_hit = _mix(
+            ((wounded if passed else nothing) + (mortal if six else nothing), chance)
+            for (passed, six), chance in wound.items()
+        )
+        hits = _mix(
+            (Summary(passed + (rules.extra_hits if six else 0), 0), chance)
+            for (passed, six), chance in hit.items()
+        )
+        return _compound(hits, per_hit)
+
+
+def _failed(outcomes: stages.Outcomes) -> fractions.Fraction:
+    return sum(chance for (passed, _), chance in outcomes.items() if not passed)
+
+
+def _bernoulli(chance: Number) -> Summary:
+    return Summary(chance, chance * (1 - chance))
+
+
+def _compound(counts: Summary, damage: Summary) -> Summary:
+    """Summary of rolling ``damage`` once for every point in ``counts``."""
+    return Summary(
+        counts.mean * damage.mean,
+        counts.mean * damage.variance + counts.variance * damage.mean ** 2,
+    )
+
+
+def _mix(outcomes: Iterable[Tuple[Summary, Number]]) -> Summary:
+    """Summary of rolling one of ``outcomes`` with the given chance."""
+    mean = 0
+    square = 0
+    for summary, chance in outcomes:
+        mean += chance * summary.mean
+        square += chance * (summary.variance + summary.mean ** 2)
+    return Summary(mean, square - mean ** 2)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def cached_attack(
+    backend: Type[Attack], effects: Tuple[models.Effect, ...], attack: models.Attack,
+) -> Damage:
+    """
+    Memoized ``backend(effects).attack(attack)``.
 
-        damages = iter(damages)
-        result = next(damages)
-        for damage in damages:
-            result *= damage
-        return result
+    Shared by every :class:`warhammer.unit_attack.UnitAttack`; use
+    ``cached_attack.cache_info()`` for hit/miss statistics and
+    ``cached_attack.cache_clear()`` to empty it.
+    """
+    return backend(effects).attack(attack)
@@ -0,0 +1,70 @@
+"""Dice expressions, such as ``D6`` or ``2D3+1``, for attacks and damage."""
+
+from __future__ import annotations
+
+import dataclasses
+import fractions
+import functools
+import re
+from typing import Union
+
+from dice_stats import Dice
+
+_PATTERN = re.compile(r"\s*(\d*)\s*[dD]\s*(\d+)\s*(?:([+-])\s*(\d+))?\s*")
+
+
+@dataclasses.dataclass(frozen=True)
+class Roll:
+    amount: int = 1
+    sides: int = 6
+    bonus: int = 0
+
+    @classmethod
+    def parse(cls, text: str) -> Roll:
+        match = _PATTERN.fullmatch(text)
+        if match is None:
+            raise ValueError(f"Invalid dice expression {text!r}.")
+        amount, sides, sign, bonus = match.groups()
+        return cls(
+            int(amount or 1),
+            int(sides),
+            0 if bonus is None else int(sign + bonus),
+        )
+
+    def __str__(self) -> str:
+        amount = "" if self.amount == 1 else str(self.amount)
+        bonus = f"{self.bonus:+}" if self.bonus else ""
+        return f"{amount}D{self.sides}{bonus}"
+
+
+Value = Union[int, Roll]
+
+
+@functools.lru_cache(maxsize=None)
+def distribution(amount: int, sides: int) -> Dice:
+    """Total of ``amount`` ``sides`` sided dice, by convolving cached halves."""
+    if amount < 1:
+        return Dice({0: fractions.Fraction(1, 1)})
+    if amount == 1:
+        return Dice({i: fractions.Fraction(1, sides) for i in range(1, sides + 1)})
+    half = amount // 2
+    return distribution(half, sides) + distribution(amount - half, sides)
+
+
+def roll(value: Value) -> Dice:
+    """Distribution of a value, a point for plain ``int``\\s."""
+    if isinstance(value, Roll):
+        return distribution(value.amount, value.sides) + value.bonus
+    return Dice({value: fractions.Fraction(1, 1)})
+
+
+def mean(value: Value) -> Union[int, fractions.Fraction]:
+    if isinstance(value, Roll):
+        return value.amount * fractions.Fraction(value.sides + 1, 2) + value.bonus
+    return value
+
+
+def variance(value: Value) -> Union[int, fractions.Fraction]:
+    if isinstance(value, Roll):
+        return value.amount * fractions.Fraction(value.sides ** 2 - 1, 12)
+    return 0
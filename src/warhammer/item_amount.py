@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import numbers
 import operator
 from typing import Callable, Dict, Generic, Iterator, Tuple, TypeVar, Union
@@ -26,7 +27,7 @@ class ItemAmount(Generic[T]):
 
     def iter_all(self) -> Iterator[T]:
         for item, amount in self._items.items():
-            yield from [item] * amount
+            yield from itertools.repeat(item, amount)
 
     def iter_amount(self) -> Iterator[Tuple[T, int]]:
         for item, amount in self._items.items():
@@ -35,6 +36,22 @@ class ItemAmount(Generic[T]):
     def iter_unique(self) -> Iterator[T]:
         yield from self._items.keys()
 
+    def total(self) -> Number:
+        return sum(self._items.values())
+
+    def split(self, amount: Number) -> Tuple[ItemAmount[T], ItemAmount[T]]:
+        """Split off the first ``amount`` items, as if slicing :meth:`iter_all`."""
+        head = {}
+        tail = {}
+        for item, count in self._items.items():
+            taken = min(count, amount)
+            amount -= taken
+            if taken:
+                head[item] = taken
+            if count - taken:
+                tail[item] = count - taken
+        return type(self)(head), type(self)(tail)
+
     def __add__(self, other: Union[Number, ItemAmount[T]]) -> ItemAmount[T]:
         return _item_amount_operator(self, other, operator.add)
 
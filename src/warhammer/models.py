@@ -2,12 +2,55 @@ from __future__ import annotations
 
 import dataclasses
 import enum
-from typing import Any, Dict, Optional, Tuple
+import weakref
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
 
-from . import item_amount
+from . import dice, item_amount
 from ._io.effects_store import EffectsStore
 
 store = EffectsStore()
+T = TypeVar("T")
+
+
+def _slotted(cls: Type[T]) -> Type[T]:
+    """
+    Rebuild a frozen dataclass with ``__slots__`` and a cached hash.
+
+    The hash isn't pickled, as string hashes differ between processes.
+    """
+    names = tuple(field.name for field in dataclasses.fields(cls))
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names + ("__dict__", "__weakref__")
+    }
+    inherited = {
+        slot for base in cls.__mro__[1:] for slot in getattr(base, "__slots__", ())
+    }
+    namespace["__slots__"] = tuple(
+        name for name in names + ("_hash", "__weakref__") if name not in inherited
+    )
+    hash_ = cls.__hash__
+
+    def __hash__(self: T) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash_(self)
+            object.__setattr__(self, "_hash", value)
+            return value
+
+    def __getstate__(self: T) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in names)
+
+    def __setstate__(self: T, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(names, state):
+            object.__setattr__(self, name, value)
+
+    namespace.update(
+        __hash__=__hash__, __getstate__=__getstate__, __setstate__=__setstate__,
+    )
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
 
 
 class EffectType(enum.Enum):
@@ -16,6 +59,7 @@ class EffectType(enum.Enum):
 
 
 @store.register
+@_slotted
 @dataclasses.dataclass(frozen=True)
 class Effect:
     name: str
@@ -24,6 +68,57 @@ class Effect:
     attacker_range: Optional[int] = None
 
 
+class Stage(enum.Enum):
+    HIT = "Hit"
+    WOUND = "Wound"
+    SAVE = "Save"
+    FEEL_NO_PAIN = "FeelNoPain"
+
+
+@_slotted
+@dataclasses.dataclass(frozen=True)
+class StageEffect(Effect):
+    stage: Stage = Stage.HIT
+    value: Optional[int] = 0
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "stage", Stage(self.stage))
+
+
+@store.register
+@_slotted
+@dataclasses.dataclass(frozen=True)
+class Reroll(StageEffect):
+    """Reroll rolls of ``value`` or less, or every failed roll if ``None``."""
+
+    value: Optional[int] = 1
+
+
+@store.register
+@_slotted
+@dataclasses.dataclass(frozen=True)
+class Modifier(StageEffect):
+    pass
+
+
+@store.register
+@_slotted
+@dataclasses.dataclass(frozen=True)
+class ExplodingSixes(Effect):
+    """Hit rolls of 6 score ``value`` extra hits."""
+
+    value: int = 1
+
+
+@store.register
+@_slotted
+@dataclasses.dataclass(frozen=True)
+class MortalWounds(Effect):
+    """Wound rolls of 6 also inflict ``value`` mortal wounds."""
+
+    value: int = 1
+
+
 @dataclasses.dataclass
 class EffectJSON:
     name: str
@@ -37,17 +132,23 @@ class EffectJSON:
 
 class WeaponType(enum.Enum):
     MELEE = "Melee"
+    ASSAULT = "Assault"
+    GRENADE = "Grenade"
+    HEAVY = "Heavy"
+    PISTOL = "Pistol"
+    RAPID_FIRE = "Rapid Fire"
 
 
+@_slotted
 @dataclasses.dataclass(frozen=True)
 class Weapon:
     name: str
     range: int
     type: WeaponType
-    attacks: int
+    attacks: dice.Value
     strength: int
     armour_penetration: int
-    damage: int
+    damage: dice.Value
     effects: Tuple[Effect, ...]
 
 
@@ -58,6 +159,7 @@ class WeaponAmount(item_amount.ItemAmount[Weapon]):
         )
 
 
+@_slotted
 @dataclasses.dataclass(frozen=True)
 class Model:
     name: str
@@ -77,19 +179,53 @@ class Model:
     effects: Tuple[Effect, ...]
 
 
+@_slotted
 @dataclasses.dataclass(frozen=True)
 class ModelWrapper:
     model: Model
     weapons: WeaponAmount
     effects: Tuple[Effect, ...]
 
+    @classmethod
+    def intern(
+        cls, model: Model, weapons: WeaponAmount, effects: Tuple[Effect, ...]
+    ) -> ModelWrapper:
+        """Get the shared wrapper of ``model`` with the same weapons and effects."""
+        effects = intern_effects(effects)
+        key = model, tuple(weapons.iter_amount()), effects
+        try:
+            return _wrappers[key]
+        except KeyError:
+            wrapper = _wrappers[key] = cls(model, weapons, effects)
+            return wrapper
 
-@dataclasses.dataclass
+
+_wrappers: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+_effects: Dict[Tuple[Effect, ...], Tuple[Effect, ...]] = {}
+
+
+def intern_effects(effects: Tuple[Effect, ...]) -> Tuple[Effect, ...]:
+    """
+    Get the shared tuple equal to ``effects``.
+
+    There are only a handful of effect combinations, so they're kept forever.
+    """
+    return _effects.setdefault(effects, effects)
+
+
+def attack_skill(model: Model, weapon: Weapon) -> int:
+    if weapon.type is WeaponType.MELEE:
+        return model.weapon_skill
+    return model.ballistic_skill
+
+
+@_slotted
+@dataclasses.dataclass(frozen=True)
 class Attack:
     attack_skill: int
-    attacks: int
+    attacks: dice.Value
     armour_penetration: int
-    damage: int
+    damage: dice.Value
     strength: int
     toughness: int
     wounds: int
@@ -102,11 +238,7 @@ class Attack:
         cls, model: Model, weapon: Weapon, target: Model,
     ):
         return cls(
-            (
-                model.weapon_skill
-                if weapon.type is WeaponType.MELEE
-                else model.ballistic_skill
-            ),
+            attack_skill(model, weapon),
             weapon.attacks,
             weapon.armour_penetration,
             weapon.damage,
@@ -0,0 +1,94 @@
+"""Compile effects into per stage roll tables for :class:`warhammer.attacks.Attack`."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import fractions
+import functools
+from typing import Dict, Iterable, Optional, Tuple
+
+from . import models
+
+Fraction = fractions.Fraction
+SIXTH = Fraction(1, 6)
+FACES = range(1, 7)
+# (passed, natural 6) to chance.
+Outcomes = Dict[Tuple[bool, bool], Fraction]
+
+
+@functools.lru_cache(maxsize=None)
+def roll(skill: int, reroll: Optional[int] = 0, modifier: int = 0) -> Outcomes:
+    """
+    Outcomes of a D6 needing ``skill``, after rerolls and the modifier.
+
+    Rolls of ``reroll`` or less are rerolled once, or every failed roll
+    if ``reroll`` is ``None``. A natural 1 always fails.
+    """
+
+    def passed(face: int) -> bool:
+        return face != 1 and face + modifier >= skill
+
+    outcomes: Outcomes = collections.defaultdict(Fraction)
+    for face in FACES:
+        if passed(face) if reroll is None else face > reroll:
+            outcomes[passed(face), face == 6] += SIXTH
+            continue
+        for face in FACES:
+            outcomes[passed(face), face == 6] += SIXTH * SIXTH
+    return dict(outcomes)
+
+
+@dataclasses.dataclass(frozen=True)
+class StageRules:
+    reroll: Optional[int] = 0
+    modifier: int = 0
+
+    def roll(self, skill: int) -> Outcomes:
+        return roll(skill, self.reroll, self.modifier)
+
+    def add(self, effect: models.StageEffect) -> StageRules:
+        if isinstance(effect, models.Modifier):
+            return dataclasses.replace(self, modifier=self.modifier + effect.value)
+        if self.reroll is None or effect.value is None:
+            return dataclasses.replace(self, reroll=None)
+        return dataclasses.replace(self, reroll=max(self.reroll, effect.value))
+
+
+@dataclasses.dataclass(frozen=True)
+class Rules:
+    hit: StageRules = StageRules()
+    wound: StageRules = StageRules()
+    save: StageRules = StageRules()
+    feel_no_pain: StageRules = StageRules()
+    extra_hits: int = 0
+    mortal_wounds: int = 0
+
+
+def _compile(effects: Iterable[models.Effect]) -> Rules:
+    stages: Dict[str, StageRules] = {}
+    extra_hits = 0
+    mortal_wounds = 0
+    for effect in effects:
+        if isinstance(effect, models.StageEffect):
+            stage = effect.stage.name.lower()
+            stages[stage] = stages.get(stage, StageRules()).add(effect)
+        elif isinstance(effect, models.ExplodingSixes):
+            extra_hits += effect.value
+        elif isinstance(effect, models.MortalWounds):
+            mortal_wounds += effect.value
+    return Rules(extra_hits=extra_hits, mortal_wounds=mortal_wounds, **stages)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_effects(effects: Tuple[models.Effect, ...]) -> Optional[Rules]:
+    """
+    Rules for a combination of effects, ``None`` if none change the rolls.
+
+    Cached per combination, as :func:`warhammer.unit_attack.extract_effects`
+    returns interned, sorted, tuples.
+    """
+    rules = _compile(effects)
+    if rules == Rules():
+        return None
+    return rules
@@ -0,0 +1,65 @@
+"""Evaluate grids of independent matchups across a process pool."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import itertools
+import numbers
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Type
+
+from . import attacks, models, unit
+
+Number = numbers.Real
+Job = Tuple[
+    unit.Unit, unit.Unit, Number, Tuple[models.Effect, ...], bool, Type[attacks.Attack]
+]
+
+
+@dataclasses.dataclass(frozen=True)
+class Row:
+    attacker: str
+    target: str
+    distance: Number
+    modifier: str
+    result: Any
+
+
+def _evaluate(job: Job) -> Any:
+    attacker, target, distance, effects, expected, backend = job
+    unit_attack = attacker.effects(*effects).backend(backend)
+    if expected:
+        unit_attack.expected(target, distance)
+    else:
+        unit_attack.attack(target, distance)
+    return unit_attack.sanitize().damages()[0]
+
+
+def sweep(
+    attackers: Mapping[str, unit.Unit],
+    targets: Mapping[str, unit.Unit],
+    distances: Iterable[Number] = (0,),
+    modifiers: Optional[Mapping[str, Tuple[models.Effect, ...]]] = None,
+    *,
+    expected: bool = False,
+    backend: Type[attacks.Attack] = attacks.Attack,
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+) -> List[Row]:
+    """
+    Attack every target with every attacker, at every distance and modifier.
+
+    Each matchup is evaluated in a worker process, ``chunksize`` at a
+    time. Rows are returned in :func:`itertools.product` order of the
+    arguments, regardless of which worker finishes first.
+    """
+    if modifiers is None:
+        modifiers = {"": ()}
+    keys = list(itertools.product(attackers, targets, distances, modifiers))
+    jobs = [
+        (attackers[a], targets[t], d, modifiers[m], expected, backend)
+        for a, t, d, m in keys
+    ]
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        results = executor.map(_evaluate, jobs, chunksize=chunksize)
+        return [Row(*key, result) for key, result in zip(keys, results)]
@@ -0,0 +1,95 @@
+"""
+Precomputed roll targets and chances for stats ``0`` to :data:`LIMIT`.
+
+Armour penetration is negative, so its axis covers ``-LIMIT`` to
+``LIMIT`` and is indexed from :data:`ARMOUR_PENETRATION`'s start.
+Stats outside the tables fall back to computing the value.
+"""
+
+from __future__ import annotations
+
+import fractions
+from typing import Tuple
+
+LIMIT = 20
+STATS = range(LIMIT + 1)
+ARMOUR_PENETRATION = range(-LIMIT, LIMIT + 1)
+Fraction = fractions.Fraction
+
+
+def _wound_skill(strength: int, toughness: int) -> int:
+    if strength >= 2 * toughness:
+        return 2
+    if strength > toughness:
+        return 3
+    if strength == toughness:
+        return 4
+    if 2 * strength <= toughness:
+        return 6
+    return 5
+
+
+def _save(save: int, armour_penetration: int, invulnerable: int) -> int:
+    return min(save - armour_penetration, invulnerable, 7)
+
+
+WOUND_SKILL: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_wound_skill(strength, toughness) for toughness in STATS)
+    for strength in STATS
+)
+SAVE: Tuple[Tuple[Tuple[int, ...], ...], ...] = tuple(
+    tuple(
+        tuple(_save(save, armour_penetration, invulnerable) for invulnerable in STATS)
+        for armour_penetration in ARMOUR_PENETRATION
+    )
+    for save in STATS
+)
+HIT: Tuple[Fraction, ...] = tuple(Fraction(7 - skill, 6) for skill in STATS)
+WOUND: Tuple[Tuple[Fraction, ...], ...] = tuple(
+    tuple(Fraction(7 - skill, 6) for skill in row) for row in WOUND_SKILL
+)
+UNSAVED: Tuple[Tuple[Tuple[Fraction, ...], ...], ...] = tuple(
+    tuple(tuple(Fraction(save - 1, 6) for save in row) for row in rows)
+    for rows in SAVE
+)
+
+
+def _in_table(*stats: int) -> bool:
+    return all(0 <= stat <= LIMIT for stat in stats)
+
+
+def _in_save_table(save: int, armour_penetration: int, invulnerable: int) -> bool:
+    return _in_table(save, invulnerable) and -LIMIT <= armour_penetration <= LIMIT
+
+
+def wound_skill(strength: int, toughness: int) -> int:
+    """Roll needed to wound."""
+    if _in_table(strength, toughness):
+        return WOUND_SKILL[strength][toughness]
+    return _wound_skill(strength, toughness)
+
+
+def save(save: int, armour_penetration: int, invulnerable: int) -> int:
+    """Roll needed to save, ``7`` if it can't be saved."""
+    if _in_save_table(save, armour_penetration, invulnerable):
+        return SAVE[save][armour_penetration + LIMIT][invulnerable]
+    return _save(save, armour_penetration, invulnerable)
+
+
+def hit_chance(attack_skill: int) -> Fraction:
+    if _in_table(attack_skill):
+        return HIT[attack_skill]
+    return Fraction(7 - attack_skill, 6)
+
+
+def wound_chance(strength: int, toughness: int) -> Fraction:
+    if _in_table(strength, toughness):
+        return WOUND[strength][toughness]
+    return Fraction(7 - _wound_skill(strength, toughness), 6)
+
+
+def unsaved_chance(save: int, armour_penetration: int, invulnerable: int) -> Fraction:
+    """Chance to fail the save."""
+    if _in_save_table(save, armour_penetration, invulnerable):
+        return UNSAVED[save][armour_penetration + LIMIT][invulnerable]
+    return Fraction(_save(save, armour_penetration, invulnerable) - 1, 6)
@@ -31,7 +31,7 @@ class Unit(item_amount.ItemAmount[TModel]):
                 raise TypeError(f"Cannot process object of type {type(arg)}")
 
         model, amount = self._items.popitem()
-        new_model = models.ModelWrapper(
+        new_model = models.ModelWrapper.intern(
             model,
             functools.reduce(operator.add, [model.weapons] + _weapons),
             model.effects + tuple(_effects),
@@ -45,7 +45,7 @@ class Unit(item_amount.ItemAmount[TModel]):
                 (
                     model
                     if isinstance(model, models.ModelWrapper)
-                    else models.ModelWrapper(model, model.weapons, model.effects)
+                    else models.ModelWrapper.intern(model, model.weapons, model.effects)
                 ): amount
                 for model, amount in self.iter_amount()
             }
@@ -3,9 +3,9 @@ from __future__ import annotations
 import dataclasses
 import fractions
 import numbers
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Type, Union
 
-from . import attacks, item_amount, models
+from . import attacks, dice, item_amount, models
 
 Number = numbers.Real
 Unit = item_amount.ItemAmount[models.ModelWrapper]
@@ -15,18 +15,24 @@ class UnitAttack:
     unit: Unit
     _auras: List[models.Effect]
     _attacks: List
-    _weapons: Dict[models.Weapon, List[models.ModelWrapper]]
+    _weapons: Dict[models.Weapon, Unit]
     _next_attack: Optional
+    _backend: Type[attacks.Attack]
 
     def __init__(self, unit: Unit) -> None:
         self.unit = unit
         self._auras = []
         self._attacks = []
-        self._weapons = weapons = {}
         self._next_attack = None
-        for model in unit.iter_all():
-            for weapon in model.weapons.iter_all():
-                weapons.setdefault(weapon, []).append(model)
+        self._backend = attacks.Attack
+        weapons: Dict[models.Weapon, Dict[models.ModelWrapper, int]] = {}
+        for model, amount in unit.iter_amount():
+            for weapon, weapon_amount in model.weapons.iter_amount():
+                weapons.setdefault(weapon, {})[model] = amount * weapon_amount
+        self._weapons = {
+            weapon: item_amount.ItemAmount(models_)
+            for weapon, models_ in weapons.items()
+        }
 
     def auras(self, *units: Unit, distance=float("inf")) -> UnitAttack:
         self._auras.extend(
@@ -44,69 +50,120 @@ class UnitAttack:
         self._auras.extend(effects)
         return self
 
+    def backend(self, backend: Type[attacks.Attack]) -> UnitAttack:
+        self._backend = backend
+        return self
+
     def weapons(self, weapons: Optional[models.WeaponAmount] = None) -> UnitAttack:
         if weapons is None:
             return self
         self._next_attack = next_attack = {}
         for weapon, amount in weapons.iter_amount():
-            _weapons = self._weapons.get(weapon, [])
-            if len(_weapons) < amount:
+            _weapons = self._weapons.get(weapon, item_amount.ItemAmount())
+            if _weapons.total() < amount:
                 self._weapons = {}
                 self._next_attack = None
                 raise ValueError(f"Not enough {weapon}.")
-            next_attack[weapon] = _weapons[:amount]
-            del _weapons[:amount]
+            next_attack[weapon], self._weapons[weapon] = _weapons.split(amount)
         return self
 
     def attack(self, target: Unit, distance: Number = 0) -> UnitAttack:
+        weapons = self._pop_weapons()
+        self._attacks.append(
+            attack(weapons, target, self._auras, distance, self._backend)
+        )
+        return self
+
+    def expected(self, target: Unit, distance: Number = 0) -> UnitAttack:
+        """Like :meth:`attack`, but only keep the mean and variance of the damage."""
+        weapons = self._pop_weapons()
+        self._attacks.append(
+            expected(weapons, target, self._auras, distance, self._backend)
+        )
+        return self
+
+    def _pop_weapons(self) -> Dict[models.Weapon, Unit]:
         if self._next_attack is None:
             weapons = self._weapons
             self._weapons = {}
         else:
             weapons = self._next_attack
             self._next_attack = None
-        self._attacks.append(attack(weapons, target, self._auras, distance))
-        return self
+        return weapons
 
     def sanitize(self) -> Sanitized:
         return Sanitized(self)
 
 
 def get_damages(
-    weapons: Dict[models.Weapon, List[models.ModelWrapper]], distance: Number, damages
+    weapons: Dict[models.Weapon, Unit],
+    distance: Number,
+    damages,
+    backend: Type[attacks.Attack] = attacks.Attack,
 ):
     for weapon, models_ in weapons.items():
         if weapon.range < distance:
             continue
-        for model in models_:
-            yield next(iter(damages[weapon, model].values()))
+        for model, amount in models_.iter_amount():
+            damage = next(iter(damages[weapon, model].values()))
+            if isinstance(weapon.attacks, dice.Roll):
+                yield attacks.convolve_power(
+                    backend.repeat(damage, weapon.attacks), amount
+                )
+            else:
+                yield attacks.convolve_power(damage, amount * weapon.attacks)
 
 
 def attack(
-    weapons: Dict[models.Weapon, List[models.ModelWrapper]],
+    weapons: Dict[models.Weapon, Unit],
     targets: Unit,
     auras: List[models.Effect],
     distance: Number,
+    backend: Type[attacks.Attack] = attacks.Attack,
 ):
     damages = {}
     for weapon, models_ in weapons.items():
         if weapon.range < distance:
             continue
-        for model in set(models_):
+        for model in models_.iter_unique():
             for target in targets.iter_unique():
                 effects = extract_effects(model, weapon, target, auras, distance)
-                damage = attacks.Attack(effects).attack(
-                    models.Attack.from_models(model.model, weapon, target.model)
+                damage = attacks.cached_attack(
+                    backend,
+                    effects,
+                    models.Attack.from_models(model.model, weapon, target.model),
                 )
                 damages.setdefault((weapon, model), {})[target] = damage
 
-    damages_ = get_damages(weapons, distance, damages)
-    damage = next(damages_)
+    damages_ = get_damages(weapons, distance, damages, backend)
+    damage = next(damages_, None)
+    if damage is None:
+        return backend.nothing()
     for d in damages_:
         damage += d
     return damage
 
 
+def expected(
+    weapons: Dict[models.Weapon, Unit],
+    targets: Unit,
+    auras: List[models.Effect],
+    distance: Number,
+    backend: Type[attacks.Attack] = attacks.Attack,
+) -> attacks.Summary:
+    target = next(targets.iter_unique())
+    summary = attacks.Summary(0, 0)
+    for weapon, models_ in weapons.items():
+        if weapon.range < distance:
+            continue
+        for model, amount in models_.iter_amount():
+            effects = extract_effects(model, weapon, target, auras, distance)
+            summary += amount * backend(effects).summary(
+                models.Attack.from_models(model.model, weapon, target.model)
+            ).repeat(weapon.attacks)
+    return summary
+
+
 def extract_effects(
     model: models.ModelWrapper,
     weapon: models.Weapon,
@@ -126,13 +183,24 @@ def extract_effects(
         if effect.type == type_
         and (effect.attacker_range is None or effect.attacker_range >= distance)
     ]
-    return tuple(sorted(effects, key=lambda i: i.name))
+    return models.intern_effects(tuple(sorted(effects, key=lambda i: i.name)))
 
 
 class Sanitized:
     def __init__(self, unit_attack: UnitAttack) -> None:
         self._unit_attack = unit_attack
 
+    def damages(self) -> List:
+        return list(self._unit_attack._attacks)
+
+    def summary(self) -> List[attacks.Summary]:
+        return [
+            attack
+            if isinstance(attack, attacks.Summary)
+            else attacks.Summary.from_damage(attack)
+            for attack in self._unit_attack._attacks
+        ]
+
     def graph(self) -> None:
         print("Graph!")
         for attack in self._unit_attack._attacks:
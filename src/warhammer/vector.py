@@ -0,0 +1,325 @@
+"""Float64 backend for :class:`warhammer.attacks.Attack`, requires ``numpy``."""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+from typing import Iterable, Iterator, Mapping, Tuple
+
+import numpy as np
+
+from . import attacks, dice, models, tables
+
+HIT = np.array(tables.HIT, dtype=np.float64)
+WOUND_SKILL = np.array(tables.WOUND_SKILL)
+WOUND = np.array(tables.WOUND, dtype=np.float64)
+SAVE = np.array(tables.SAVE)
+UNSAVED = np.array(tables.UNSAVED, dtype=np.float64)
+
+
+def compound(counts: np.ndarray, damage: np.ndarray) -> np.ndarray:
+    """Roll ``damage`` once for every point in ``counts`` and total the rolls."""
+    result = np.zeros((len(counts) - 1) * (len(damage) - 1) + 1)
+    power = np.ones(1)
+    for chance in counts:
+        result[: len(power)] += chance * power
+        power = np.convolve(power, damage)
+    return result
+
+
+def bernoulli(chance: float) -> np.ndarray:
+    return np.array([1 - chance, chance])
+
+
+def point(value: int) -> np.ndarray:
+    chances = np.zeros(value + 1)
+    chances[value] = 1
+    return chances
+
+
+def roll(value: dice.Value) -> np.ndarray:
+    if isinstance(value, dice.Roll):
+        return array(dice.roll(value))
+    return point(value)
+
+
+class Damage(Mapping[int, float]):
+    __slots__ = ("chances",)
+    chances: np.ndarray
+
+    def __init__(self, chances: np.ndarray) -> None:
+        self.chances = np.asarray(chances, dtype=np.float64)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.chances!r})"
+
+    def __getitem__(self, item: int) -> float:
+        if not 0 <= item < len(self.chances):
+            raise KeyError(item)
+        return float(self.chances[item])
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self.chances)))
+
+    def __len__(self) -> int:
+        return len(self.chances)
+
+    def __add__(self, other: Damage) -> Damage:
+        if not isinstance(other, Damage):
+            return NotImplemented
+        return type(self)(np.convolve(self.chances, other.chances))
+
+    def mean(self) -> float:
+        return float(np.arange(len(self.chances)) @ self.chances)
+
+
+def array(damage: Mapping[int, attacks.Number]) -> np.ndarray:
+    chances = np.zeros(max(damage.keys()) + 1)
+    for value, chance in damage.items():
+        chances[value] = chance
+    return chances
+
+
+class Attack(attacks.Attack):
+    @staticmethod
+    def repeat(damage: Damage, rolls: dice.Roll) -> Damage:
+        return Damage(compound(roll(rolls), damage.chances))
+
+    @staticmethod
+    def nothing() -> Damage:
+        return Damage(point(0))
+
+    def _damage(self, attack: models.Attack) -> Damage:
+        if self.rules is not None:
+            return Damage(array(self._rules_damage(attack)))
+        hit, wound, save, feel_no_pain = map(float, self.chances(attack))
+        return Damage(
+            functools.reduce(
+                compound,
+                [
+                    bernoulli(hit),
+                    bernoulli(wound),
+                    bernoulli(save),
+                    roll(attack.damage),
+                    bernoulli(feel_no_pain),
+                ],
+            )
+        )
+
+
+def _fixed(value: dice.Value) -> int:
+    if isinstance(value, dice.Roll):
+        raise TypeError(
+            f"Batched damages need fixed damage, not {value}, use Attack instead."
+        )
+    return value
+
+
+def _columns(rows: Iterable[Tuple[int, ...]]) -> np.ndarray:
+    return np.array(list(rows), dtype=np.int64).reshape(-1, 4).T
+
+
+@dataclasses.dataclass(frozen=True)
+class Attackers:
+    """
+    Attacker profiles as columns.
+
+    ``effects`` holds each attacker's offensive effects, or is empty when
+    none have any. Auras and ranges aren't known, so effects always apply.
+    """
+
+    attack_skill: np.ndarray
+    armour_penetration: np.ndarray
+    damage: np.ndarray
+    strength: np.ndarray
+    effects: Tuple[Tuple[models.Effect, ...], ...] = ()
+
+    @classmethod
+    def from_models(
+        cls, profiles: Iterable[Tuple[models.Model, models.Weapon]]
+    ) -> Attackers:
+        profiles = list(profiles)
+        return cls(
+            *_columns(
+                (
+                    models.attack_skill(model, weapon),
+                    weapon.armour_penetration,
+                    _fixed(weapon.damage),
+                    weapon.strength,
+                )
+                for model, weapon in profiles
+            ),
+            effects=tuple(
+                _effects(model.effects + weapon.effects, models.EffectType.OFFENCIVE)
+                for model, weapon in profiles
+            ),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class Targets:
+    """Target profiles as columns, ``effects`` holds their defensive effects."""
+
+    toughness: np.ndarray
+    save: np.ndarray
+    invulnerable: np.ndarray
+    feel_no_pain: np.ndarray
+    effects: Tuple[Tuple[models.Effect, ...], ...] = ()
+
+    @classmethod
+    def from_models(cls, targets: Iterable[models.Model]) -> Targets:
+        targets = list(targets)
+        return cls(
+            *_columns(
+                (
+                    target.toughness,
+                    target.save,
+                    target.invulnerable,
+                    target.feel_no_pain,
+                )
+                for target in targets
+            ),
+            effects=tuple(
+                _effects(target.effects, models.EffectType.DEFENSIVE)
+                for target in targets
+            ),
+        )
+
+
+def _effects(
+    effects: Iterable[models.Effect], type_: models.EffectType
+) -> Tuple[models.Effect, ...]:
+    return tuple(effect for effect in effects if effect.type == type_)
+
+
+def _ruled(
+    attackers: Attackers, targets: Targets
+) -> Iterator[Tuple[int, int, Attack, models.Attack]]:
+    """Attacker and target pairs whose effects change the rolls."""
+    if not attackers.effects and not targets.effects:
+        return
+    offencive = attackers.effects or ((),) * len(attackers.attack_skill)
+    defensive = targets.effects or ((),) * len(targets.toughness)
+    for i, attacker_effects in enumerate(offencive):
+        for j, target_effects in enumerate(defensive):
+            effects = models.intern_effects(
+                tuple(
+                    sorted(
+                        attacker_effects + target_effects,
+                        key=lambda effect: effect.name,
+                    )
+                )
+            )
+            attack = Attack(effects)
+            if attack.rules is None:
+                continue
+            # Wounds don't change the damage of one attack.
+            yield i, j, attack, models.Attack(
+                int(attackers.attack_skill[i]),
+                1,
+                int(attackers.armour_penetration[i]),
+                int(attackers.damage[i]),
+                int(attackers.strength[i]),
+                int(targets.toughness[j]),
+                0,
+                int(targets.save[j]),
+                int(targets.invulnerable[j]),
+                int(targets.feel_no_pain[j]),
+            )
+
+
+def _in_table(*stats: np.ndarray) -> bool:
+    return all(np.all((stat >= 0) & (stat <= tables.LIMIT)) for stat in stats)
+
+
+def wound_skill(strength: np.ndarray, toughness: np.ndarray) -> np.ndarray:
+    if _in_table(strength, toughness):
+        return WOUND_SKILL[strength, toughness]
+    return np.select(
+        [
+            strength >= 2 * toughness,
+            strength > toughness,
+            strength == toughness,
+            2 * strength <= toughness,
+        ],
+        [2, 3, 4, 6],
+        5,
+    )
+
+
+def _chances(attackers: Attackers, targets: Targets) -> Tuple[np.ndarray, np.ndarray]:
+    """Chance for each attack to get through, and for each wound to get past FNP."""
+    strength = attackers.strength[:, None]
+    armour_penetration = attackers.armour_penetration[:, None]
+    if np.all(np.abs(armour_penetration) <= tables.LIMIT) and _in_table(
+        attackers.attack_skill,
+        strength,
+        targets.toughness,
+        targets.save,
+        targets.invulnerable,
+    ):
+        unsaved = (
+            HIT[attackers.attack_skill][:, None]
+            * WOUND[strength, targets.toughness]
+            * UNSAVED[
+                targets.save, armour_penetration + tables.LIMIT, targets.invulnerable
+            ]
+        )
+        return unsaved, (targets.feel_no_pain - 1) / 6
+    save = np.minimum(
+        np.minimum(targets.save - armour_penetration, targets.invulnerable), 7
+    )
+    unsaved = (
+        (7 - attackers.attack_skill[:, None])
+        * (7 - wound_skill(strength, targets.toughness))
+        * (save - 1)
+        / 6 ** 3
+    )
+    return unsaved, (targets.feel_no_pain - 1) / 6
+
+
+def _binomials(size: int) -> np.ndarray:
+    """Pascal's triangle, ``size`` rows deep."""
+    table = np.zeros((size + 1, size + 1))
+    table[:, 0] = 1
+    for row in range(1, size + 1):
+        table[row, 1:] = table[row - 1, 1:] + table[row - 1, :-1]
+    return table
+
+
+def damages(attackers: Attackers, targets: Targets) -> np.ndarray:
+    """
+    Damage distribution of one attack for every attacker against every target.
+
+    The result has the shape ``(attackers, targets, max damage + 1)``.
+    Pairs with effects that change the rolls go through :class:`Attack`.
+    """
+    unsaved, feel_no_pain = _chances(attackers, targets)
+    damage = attackers.damage[:, None, None]
+    points = np.arange(attackers.damage.max(initial=0) + 1)
+    binomials = _binomials(len(points) - 1)[attackers.damage][:, None, :]
+    feel_no_pain = feel_no_pain[None, :, None]
+    result = (
+        unsaved[:, :, None]
+        * binomials
+        * feel_no_pain ** points
+        * (1 - feel_no_pain) ** np.maximum(damage - points, 0)
+    )
+    result[:, :, 0] += 1 - unsaved
+    for i, j, attack, profile in _ruled(attackers, targets):
+        chances = attack.attack(profile).chances
+        if len(chances) > result.shape[2]:
+            padding = len(chances) - result.shape[2]
+            result = np.pad(result, [(0, 0), (0, 0), (0, padding)])
+        result[i, j] = 0
+        result[i, j, : len(chances)] = chances
+    return result
+
+
+def expected(attackers: Attackers, targets: Targets) -> np.ndarray:
+    """Mean damage of one attack for every attacker against every target."""
+    unsaved, feel_no_pain = _chances(attackers, targets)
+    means = unsaved * attackers.damage[:, None] * feel_no_pain
+    for i, j, attack, profile in _ruled(attackers, targets):
+        means[i, j] = attack.summary(profile).mean
+    return means
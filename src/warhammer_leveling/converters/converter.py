@@ -1,8 +1,11 @@
+import functools
 from datetime import datetime
 from typing import (
     Any,
+    Dict,
     Generic,
     List,
+    NamedTuple,
     Optional,
     Tuple,
     Type,
@@ -31,28 +34,50 @@ class BuilderObject:
         del super().__getattribute__("__values")[name]
 
 
+class _Field(NamedTuple):
+    type: Type
+    nested: bool
+
+
+@functools.lru_cache(maxsize=None)
+def _plan(base: Type) -> Dict[str, _Field]:
+    """Each field's type and whether it can be built from a `BuilderObject`."""
+    return {
+        name: _Field(type_, isinstance(type_, type))
+        for name, type_ in get_type_hints(base).items()
+    }
+
+
 def _build(base: Type[T], values: Union[BuilderObject, dict], exists_ok) -> T:
     """Build the object recursively, utilizes the type hints to create the correct types"""
-    types = get_type_hints(base)
+    plan = _plan(base)
     if isinstance(values, BuilderObject):
         values = super(BuilderObject, values).__getattribute__("__values")
     for name, value in values.items():
         if isinstance(value, Converter):
             values[name] = value.build(exists_ok=exists_ok)
-        elif isinstance(value, BuilderObject) and name in types:
-            values[name] = _build(types[name], value, exists_ok)
+        elif isinstance(value, BuilderObject) and name in plan:
+            field = plan[name]
+            if not field.nested:
+                raise TypeError(f"Can't build {name}, {field.type!r} isn't a class.")
+            values[name] = _build(field.type, value, exists_ok)
     return base(**values)
 
 
-def _get_args(obj: object, orig: Type) -> Optional[Tuple[Type]]:
-    """Get args from obj, filtering by orig type"""
-    bases = getattr(type(obj), "__orig_bases__", [])
+@functools.lru_cache(maxsize=None)
+def _get_class_args(cls: Type, orig: Type) -> Optional[Tuple[Type]]:
+    bases = getattr(cls, "__orig_bases__", [])
     for b in bases:
         if b.__origin__ is orig:
             return b.__args__
     return None
 
 
+def _get_args(obj: object, orig: Type) -> Optional[Tuple[Type]]:
+    """Get args from obj, filtering by orig type"""
+    return _get_class_args(type(obj), orig)
+
+
 class Converter(Generic[T]):
     _obj: T
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, Tuple
 
 from typing_extensions import Protocol
 
@@ -13,6 +13,9 @@ class Converter(Protocol):
     def load(self, value):
         ...
 
+    def loader(self) -> Callable[[Any], Any]:
+        ...
+
     def dump(self, value):
         ...
 
@@ -24,6 +27,9 @@ class String:
     def load(self, value):
         return str(value)
 
+    def loader(self):
+        return str
+
     def dump(self, value):
         return str(value)
 
@@ -35,6 +41,9 @@ class Integer:
     def load(self, value):
         return int(value)
 
+    def loader(self):
+        return int
+
     def dump(self, value):
         return int(value)
 
@@ -42,14 +51,41 @@ class Integer:
 class Union:
     def __init__(self, *converters):
         self.converters = converters
+        self._tags = {}
+        untagged = []
+        for converter in converters:
+            tag = getattr(converter, "tag", None)
+            if tag is None:
+                untagged.append(converter)
+            else:
+                self._tags.setdefault(tag, converter.loader())
+        self._untagged = tuple(untagged)
+        self._load = self._compile()
 
     def load_valid(self, value):
         return 1 == sum(conv.load_valid(value) for conv in self.converters)
 
     def load(self, value):
-        for converter in self.converters:
-            if converter.load_valid(value):
-                return converter.load(value)
+        return self._load(value)
+
+    def loader(self):
+        return self._load
+
+    def _compile(self):
+        """Dispatch models on their ``_model`` tag, other values by validity."""
+        tags = self._tags
+        untagged = self._untagged
+
+        def load(value):
+            if isinstance(value, dict) and "_model" in value:
+                loader = tags.get(value["_model"])
+                if loader is not None:
+                    return loader(value)
+            for converter in untagged:
+                if converter.load_valid(value):
+                    return converter.load(value)
+
+        return load
 
     def dump(self, value):
         pass
@@ -66,6 +102,9 @@ class Enum:
     def load(self, value):
         return self._from_values[value]
 
+    def loader(self):
+        return self._from_values.__getitem__
+
     def dump(self, value):
         pass
 
@@ -81,18 +120,43 @@ class ModelField:
 class ModelBuilder:
     model: Any
     fields: Tuple[ModelField, ...]
+    _load: Callable[[Dict[str, Any]], Any] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._load = self._compile()
+
+    @property
+    def tag(self):
+        return self.model.__name__
 
     def load_valid(self, value):
         return value["_model"] == self.model.__name__
 
     def load(self, value):
-        value.pop("_model", None)
-        return self.model(
-            **{
-                field.internal_name: field.converter.load(value[field.external_name])
-                for field in self.fields
-            }
+        return self._load(value)
+
+    def loader(self):
+        return self._load
+
+    def _compile(self):
+        """Build a loader that calls each field's loader directly."""
+        model = self.model
+        fields = tuple(
+            (field.internal_name, field.external_name, field.converter.loader())
+            for field in self.fields
         )
 
+        def load(value):
+            return model(
+                **{
+                    internal_name: loader(value[external_name])
+                    for internal_name, external_name, loader in fields
+                }
+            )
+
+        return load
+
     def dump(self, value):
         pass
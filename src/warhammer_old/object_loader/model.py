@@ -29,9 +29,23 @@ class ModelReference:
     def load_valid(self, value):
         return self.models.models[self.model].load_valid(value)
 
+    @property
+    def tag(self):
+        return self.model
+
     def load(self, value):
         return self.models.models[self.model].load(value)
 
+    def loader(self):
+        """Defer to the model's loader, as it's not built yet."""
+        models = self.models.models
+        name = self.model
+
+        def load(value):
+            return models[name].load(value)
+
+        return load
+
     def dump(self, value):
         return self.models.models[self.model].dump(value)
 
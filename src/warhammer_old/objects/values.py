@@ -1,9 +1,47 @@
 from __future__ import annotations
 
+import collections
 import dataclasses
 import enum
+import functools
 import itertools
-from typing import Union
+import operator
+import types
+from typing import Callable, Dict, Iterator, Mapping, Union
+
+# Value to how many ways it can be rolled.
+Histogram = Mapping[int, int]
+
+
+def _histogram(counts: Dict[int, int]) -> Histogram:
+    return types.MappingProxyType(dict(counts))
+
+
+def _combine(
+    lhs: Histogram, rhs: Histogram, function: Callable[[int, int], int]
+) -> Histogram:
+    counts: Dict[int, int] = collections.defaultdict(int)
+    for left, left_count in lhs.items():
+        for right, right_count in rhs.items():
+            counts[function(left, right)] += left_count * right_count
+    return _histogram(counts)
+
+
+def _expand(histogram: Histogram) -> Iterator[int]:
+    """Every outcome, with repeats, without building them all at once."""
+    return itertools.chain.from_iterable(
+        itertools.repeat(value, count) for value, count in histogram.items()
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _dice(amount: int, range_: int) -> Histogram:
+    if amount < 1:
+        return _histogram({0: 1})
+    if amount == 1:
+        return _histogram({value: 1 for value in range(1, range_ + 1)})
+    half = amount // 2
+    return _combine(_dice(half, range_), _dice(amount - half, range_), operator.add)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -13,8 +51,11 @@ class Constant:
     def __str__(self):
         return f"{self.value}"
 
+    def histogram(self, parent) -> Histogram:
+        return _histogram({self.value: 1})
+
     def values(self, parent):
-        return [self.value]
+        return _expand(self.histogram(parent))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -24,8 +65,11 @@ class Relative:
     def __str__(self):
         return ""
 
+    def histogram(self, parent) -> Histogram:
+        return getattr(parent, self.stat).histogram(parent)
+
     def values(self, parent):
-        return getattr(parent, self.stat).values(parent)
+        return _expand(self.histogram(parent))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -36,13 +80,11 @@ class Dice:
     def __str__(self):
         return f'{self.amount if self.amount > 1 else ""}D{self.range}'
 
+    def histogram(self, parent) -> Histogram:
+        return _dice(self.amount, self.range)
+
     def values(self, parent):
-        return [
-            sum(values)
-            for values in itertools.product(
-                range(1, self.range + 1), repeat=self.amount
-            )
-        ]
+        return _expand(self.histogram(parent))
 
 
 BasicValue = Union[Constant, Relative, Dice]
@@ -53,6 +95,12 @@ class Operators(enum.Enum):
     SUB = "-"
 
 
+_FUNCTIONS = {
+    Operators.ADD: operator.add,
+    Operators.SUB: operator.sub,
+}
+
+
 @dataclasses.dataclass(frozen=True)
 class Combination:
     lhs: Union[BasicValue, Combination]
@@ -62,12 +110,15 @@ class Combination:
     def __str__(self):
         return f"{self.lhs}{self.operator.value}{self.rhs}"
 
+    def histogram(self, parent) -> Histogram:
+        return _combine(
+            self.lhs.histogram(parent),
+            self.rhs.histogram(parent),
+            _FUNCTIONS[self.operator],
+        )
+
     def values(self, parent):
-        return [
-            left + right
-            for left in self.lhs.values(parent)
-            for right in self.rhs.values(parent)
-        ]
+        return _expand(self.histogram(parent))
 
 
 Value = Union[BasicValue, Combination]
@@ -2,6 +2,7 @@
 import collections
 import functools
 import itertools
+import math
 import operator
 from fractions import Fraction
 from typing import Optional
@@ -192,16 +193,20 @@ def phase(*buffs):
     return dict(totals)
 
 
+def add_damage(totals, damage):
+    new_totals = collections.defaultdict(int)
+    for d1, c1 in damage.items():
+        for d2, c2 in totals.items():
+            new_totals[d1 + d2] += c1 * c2
+    return new_totals
+
+
 def additive_damage(*damages):
     totals = collections.defaultdict(int)
     totals[0] = Fraction(1, 1)
     yield totals
     for damage in damages:
-        new_totals = collections.defaultdict(int)
-        for d1, c1 in damage.items():
-            for d2, c2 in totals.items():
-                new_totals[d1 + d2] += c1 * c2
-        totals = new_totals
+        totals = add_damage(totals, damage)
         yield totals
 
 
@@ -218,10 +223,8 @@ def damage(*buffs):
 
 def binomial(n, k):
     a, b = sorted((k, n - k))
-    return int(
-        functools.reduce(operator.mul, range(b + 1, n + 1), 1)
-        / functools.reduce(operator.mul, range(1, a + 1), 1)
-    )
+    numerator = functools.reduce(operator.mul, range(b + 1, n + 1), 1)
+    return numerator // functools.reduce(operator.mul, range(1, a + 1), 1)
 
 
 def _attack_(phase, hit):
@@ -232,55 +235,108 @@ def _attack_(phase, hit):
         hit[k] = hit.get(k, 0) + v
 
 
+def _scaled(*chances):
+    """Numerators of ``chances`` over their lowest common denominator."""
+    chances = [Fraction(chance) for chance in chances]
+    denominator = functools.reduce(
+        lambda a, b: a * b // math.gcd(a, b), (c.denominator for c in chances), 1
+    )
+    return [int(chance * denominator) for chance in chances], denominator
+
+
 def _multiply(bonus, dict):
     return {k: bonus * v + v for k, v in dict.items()}
 
 
-def chances(hit, miss, size):
-    for i in range(size + 1):
-        bin = binomial(size, i)
-        yield (hit ** i * miss ** (size - i)) * bin
+class Pipeline:
+    """
+    :func:`attack_` built once from the phases, and evaluated per attack count.
+
+    The phases aren't mutated.
+    """
+
+    def __init__(self, *phases):
+        hit, wound, save, damage, fnp, *_ = (*phases, None, None, None, None)
+        hit = dict(hit)
+        hit["misses"] = {"hit": hit["misses"]}
+
+        if wound is not None:
+            wound = dict(wound)
+            hit["misses"]["wound"] = wound.pop("misses") * hit[Score]
+            _attack_(wound, hit)
+
+        if save is not None:
+            save = dict(save)
+            hit["misses"]["save"] = save.pop(Score) * hit[Score]
+            save[Score] = save.pop("misses")
+            _attack_(save, hit)
+
+        self.attacks = None
+        self._damage = None
+        if damage is not None:
+            self.attacks = damage.get(Attacks, 1)
+            self._damage = damage["damage"]
+            (self._hits, self._misses), self._denominator = _scaled(
+                hit.pop(Score), sum(hit["misses"].values())
+            )
+            chances, self._damage_denominator = _scaled(*self._damage.values())
+            self._counts = dict(zip(self._damage.keys(), chances))
+            self._powers = [{0: 1}]
+
+        if fnp is not None:
+            pass
+            # fnp[Score], fnp['misses'] = fnp['misses'], fnp[Score]
+            # _attack_(save, hit)
+        self._hit = hit
+
+    def _power(self, k):
+        """
+        Total of ``k`` damage rolls, as numerators over the k-th power of the
+        damage's denominator, cached between evaluations.
+        """
+        while len(self._powers) <= k:
+            self._powers.append(add_damage(self._powers[-1], self._counts))
+        return self._powers[k]
+
+    def damage(self, attacks):
+        """
+        Binomial sum of damage rolls, without the term where every attack misses.
+
+        The sum is kept over a common denominator, as adding fractions is
+        where the time goes.
+        """
+        total_damage = collections.defaultdict(int)
+        if not attacks:
+            return total_damage
+        hit, miss = self._hits, self._misses
+        damage = self._damage_denominator
+        for k in range(1, attacks + 1):
+            weight = binomial(attacks, k) * hit ** k * (miss * damage) ** (attacks - k)
+            for value, count in self._power(k).items():
+                total_damage[value] += weight * count
+        denominator = (self._denominator * damage) ** attacks
+        for value, numerator in total_damage.items():
+            total_damage[value] = Fraction(numerator, denominator)
+        if not total_damage.get(0):
+            total_damage.pop(0, None)
+        return total_damage
+
+    def __call__(self, attacks=None):
+        hit = dict(self._hit)
+        if self._damage is not None:
+            hit["damage"] = self.damage(self.attacks if attacks is None else attacks)
+        bonus_attacks = hit.pop(BonusAttack, 0)
+        misses = hit.pop("misses")
+        damage = hit.pop("damage", None)
+        hit = _multiply(bonus_attacks, hit)
+        hit["misses"] = _multiply(bonus_attacks, misses)
+        if damage is not None:
+            hit["damage"] = _multiply(bonus_attacks, damage)
+        return hit
 
 
 def attack_(*phases):
-    hit, wound, save, damage, fnp, *_ = (*phases, None, None, None, None)
-    hit["misses"] = {"hit": hit["misses"]}
-
-    if wound is not None:
-        hit["misses"]["wound"] = wound.pop("misses") * hit[Score]
-        _attack_(wound, hit)
-
-    if save is not None:
-        hit["misses"]["save"] = save.pop(Score) * hit[Score]
-        save[Score] = save.pop("misses")
-        _attack_(save, hit)
-
-    if damage is not None:
-        hit_chance = hit.pop(Score)
-        miss_chance = sum(hit["misses"].values())
-        attacks = damage.pop(Attacks, 1)
-        total_damage = collections.defaultdict(int)
-        damages = additive_damage(*[damage["damage"]] * (attacks + 1))
-        values = zip(chances(hit_chance, miss_chance, attacks), damages)
-        next(values, None)
-        for chance, damage in values:
-            for k, v in damage.items():
-                total_damage[k] += chance * v
-        hit["damage"] = total_damage
-
-    if fnp is not None:
-        pass
-        # fnp[Score], fnp['misses'] = fnp['misses'], fnp[Score]
-        # _attack_(save, hit)
-
-    bonus_attacks = hit.pop(BonusAttack, 0)
-    misses = hit.pop("misses")
-    damage = hit.pop("damage", None)
-    hit = _multiply(bonus_attacks, hit)
-    hit["misses"] = _multiply(bonus_attacks, misses)
-    if damage is not None:
-        hit["damage"] = _multiply(bonus_attacks, damage)
-    return hit
+    return Pipeline(*phases)()
 
 
 def plot(value):
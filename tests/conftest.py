@@ -0,0 +1,46 @@
+import pathlib
+import shutil
+
+import pytest
+
+from warhammer import models
+from warhammer._io import compiled, store
+
+
+@pytest.fixture
+def codex_dir(tmp_path, monkeypatch):
+    # type: (...) -> pathlib.Path
+    """A copy of the chaos.csm codex, that stores are loaded from and saved to."""
+    path = tmp_path / "data" / "chaos.csm"
+    shutil.copytree(store._PATH / "data" / "chaos.csm", path)
+    monkeypatch.setattr(store, "_PATH", tmp_path)
+    monkeypatch.setattr(compiled, "_PATH", tmp_path)
+    return path
+
+
+@pytest.fixture
+def boltgun():
+    # type: () -> models.Weapon
+    return models.Weapon("Boltgun", 24, None, 2, 4, 1, 2, ())
+
+
+@pytest.fixture
+def marine(boltgun):
+    # type: (models.Weapon) -> models.Model
+    return models.Model(
+        "Marine",
+        1,
+        6,
+        3,
+        3,
+        4,
+        4,
+        1,
+        1,
+        7,
+        3,
+        7,
+        5,
+        models.WeaponAmount.from_item(boltgun),
+        (),
+    )
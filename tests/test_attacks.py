@@ -0,0 +1,66 @@
+import fractions
+
+from warhammer import attacks, models
+
+PROFILE = models.Attack(3, 1, 0, 2, 4, 4, 1, 3, 7, 6)
+
+
+def test_cached_attack():
+    # type: () -> None
+    attacks.cached_attack.cache_clear()
+    first = attacks.cached_attack(attacks.Attack, (), PROFILE)
+    second = attacks.cached_attack(
+        attacks.Attack, (), models.Attack(3, 1, 0, 2, 4, 4, 1, 3, 7, 6)
+    )
+    assert first is second
+    info = attacks.cached_attack.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert dict(first) == dict(attacks.Attack(()).attack(PROFILE))
+    attacks.cached_attack.cache_clear()
+    assert attacks.cached_attack.cache_info().currsize == 0
+
+
+def test_convolve_power():
+    # type: () -> None
+    damage = attacks.Attack(()).attack(PROFILE)
+    for k in range(1, 10):
+        assert dict(attacks.convolve_power(damage, k)) == dict(damage * k)
+
+
+def test_trace():
+    # type: () -> None
+    records = []
+    with attacks.trace(records.append) as traces:
+        attacks.Attack(()).attack(PROFILE)
+    attacks.Attack(()).attack(PROFILE)
+    assert traces == []
+    assert [(r.backend, r.attack, r.effects) for r in records] == [
+        (attacks.Attack, PROFILE, ())
+    ]
+    with attacks.trace() as traces:
+        attacks.Attack(()).attack(PROFILE)
+    assert len(traces) == 1 and traces[0].seconds >= 0
+
+
+def test_effects():
+    # type: () -> None
+    offencive = models.EffectType.OFFENCIVE
+    reroll = models.Reroll("RerollOnes", offencive, stage=models.Stage.HIT)
+    modifier = models.Modifier("Plus", offencive, stage="Wound", value=1)
+    damage = attacks.Attack((reroll, modifier)).attack(PROFILE)
+    # 7/9 hit, 2/3 wound, 2/6 unsaved, 5/6 get past FNP per point.
+    chance = fractions.Fraction(7, 9) * fractions.Fraction(2, 3) / 3
+    assert dict(damage) == {
+        0: 1 - chance + chance / 36,
+        1: chance * 2 * fractions.Fraction(5, 36),
+        2: chance * fractions.Fraction(25, 36),
+    }
+    assert attacks.Attack((models.Effect("Flavour"),)).rules is None
+    summary = attacks.Attack((reroll, modifier)).summary(PROFILE)
+    assert summary == attacks.Summary.from_damage(damage)
+
+    sixes = (models.ExplodingSixes("Sixes"), models.MortalWounds("Mortal", value=2))
+    damage = attacks.Attack(sixes).attack(PROFILE)
+    assert max(damage.keys()) == 8
+    summary = attacks.Attack(sixes).summary(PROFILE)
+    assert summary == attacks.Summary.from_damage(damage)
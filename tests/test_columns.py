@@ -0,0 +1,44 @@
+import dataclasses
+
+import pytest
+
+from warhammer._io import store
+
+np = pytest.importorskip("numpy")
+from warhammer._io import columns  # isort:skip
+
+
+def test_columns():
+    # type: () -> None
+    stores = store.stores("chaos.csm")
+    weapons = stores.weapons.columns
+    assert list(weapons.dtype.names) == [
+        "name",
+        "range",
+        "attacks",
+        "strength",
+        "armour_penetration",
+        "damage",
+    ]
+    strong = weapons[(weapons["strength"] >= 4) & (weapons["armour_penetration"] <= 0)]
+    assert list(strong["name"]) == ["Boltgun"]
+    assert list(stores.models.columns["toughness"]) == [4, 4, 4, 4]
+    assert store._UNLOADED in stores.weapons._data.values()
+
+    stores.weapons["Boltgun"] = dataclasses.replace(
+        stores.weapons["Boltgun"], strength=8
+    )
+    del stores.weapons["Lascannon"]
+    weapons = stores.weapons.columns
+    assert list(weapons["name"]) == ["Boltgun", "Chainsword"]
+    assert list(weapons["strength"]) == [8, 1]
+
+
+def test_optional():
+    # type: () -> None
+    effects = store.stores("chaos.csm").effects.columns
+    assert columns.numeric_fields(store.models.EffectJSON) == {
+        "aura_range": np.float64,
+        "attacker_range": np.float64,
+    }
+    assert effects.dtype["aura_range"] == np.float64
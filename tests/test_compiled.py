@@ -0,0 +1,38 @@
+import json
+
+from warhammer import models
+from warhammer._io import compiled, store
+
+RECORDS = [
+    {"name": "A", "range": 24, "type": "MELEE", "effects": [], "extra": None},
+    {"name": "B", "range": -3, "effects": ["X"], "kwargs": {"a": [1, 2]}},
+    {"name": "C", "range": None, "type": None, "effects": [], "big": 2 ** 40},
+]
+
+
+def test_round_trip(tmp_path):
+    # type: (...) -> None
+    path = tmp_path / compiled.FILE_NAME
+    path.write_bytes(compiled.dumps({"weapons": RECORDS, "empty": []}))
+    codex = compiled.Codex(path)
+    assert list(codex.tables["weapons"]) == RECORDS
+    assert list(codex.tables["weapons"].names()) == ["A", "B", "C"]
+    assert list(codex.tables["empty"]) == []
+    compiled.compile_codex("chaos.csm", path)
+    assert list(codex.tables["weapons"]) == RECORDS
+    assert "Boltgun" in compiled.Codex(path).tables["weapons"].names()
+
+
+def test_store_save(tmp_path):
+    # type: (...) -> None
+    path = compiled.compile_codex("chaos.csm", tmp_path / compiled.FILE_NAME)
+    table = compiled.Codex(path).tables["weapons"]
+    weapons = store.Store.load_records(
+        table, table.names(), "chaos.csm", "weapons", models.Weapon
+    )
+    original = weapons.path
+    weapons.path = tmp_path / "weapons.json"
+    assert weapons["Boltgun"].strength == 4
+    weapons.save()
+    with original.open() as f, weapons.path.open() as g:
+        assert json.load(f) == json.load(g)
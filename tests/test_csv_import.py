@@ -0,0 +1,39 @@
+import pathlib
+
+from warhammer import dice, import_weapons, models
+from warhammer._io import compiled, csv_import, store
+
+SRC = pathlib.Path(__file__).parent.parent / "src"
+CSV = SRC / "warhammer_old" / "data" / "csm.csv"
+
+
+def test_parse():
+    # type: () -> None
+    weapons, skipped = csv_import.parse_weapons(
+        [
+            ["Autocannon", "48", "Heavy", "2", "7", "-1", "2", ""],
+            ["Battle Cannon", "72", "Heavy ", "D6", "8", "-2", "D3", "Notes, more"],
+            ["Bolt Pistol", "12", "Pistol", "1", "", "", "", ""],
+            ["Bolter", "24", "Unknown", "1", "4", "0", "1", ""],
+            ["Boltgun", "24", "Rapid Fire", "1", "User", "0", "1", ""],
+            [],
+        ]
+    )
+    assert skipped == ["Bolt Pistol", "Bolter", "Boltgun"]
+    assert weapons[0] == models.Weapon(
+        "Autocannon", 48, models.WeaponType.HEAVY, 2, 7, -1, 2, ()
+    )
+    assert weapons[1].attacks == dice.Roll(1, 6)
+    assert weapons[1].damage == dice.Roll(1, 3)
+
+
+def test_import(codex_dir):
+    # type: (...) -> None
+    weapons = store.stores("chaos.csm").weapons
+    assert import_weapons(CSV, weapons) == ["Bolt Pistol"]
+    weapons.save()
+    compiled.compile_codex("chaos.csm")
+    loaded = store.stores("chaos.csm").weapons
+    assert len(loaded) == 12
+    assert loaded["Battle Cannon"].damage == dice.Roll(1, 3)
+    assert loaded["Autogun"].type is models.WeaponType.RAPID_FIRE
@@ -0,0 +1,27 @@
+import fractions
+
+import pytest
+
+from warhammer import dice
+
+
+def test_parse():
+    # type: () -> None
+    assert dice.Roll.parse("D6") == dice.Roll(1, 6, 0)
+    assert dice.Roll.parse("2d3 + 1") == dice.Roll(2, 3, 1)
+    assert str(dice.Roll(2, 6, -1)) == "2D6-1"
+    with pytest.raises(ValueError):
+        dice.Roll.parse("6")
+
+
+def test_roll():
+    # type: () -> None
+    dice.distribution.cache_clear()
+    roll = dice.roll(dice.Roll(5, 6, 1))
+    assert min(roll.keys()) == 6 and max(roll.keys()) == 31
+    assert sum(value * chance for value, chance in roll.items()) == dice.mean(
+        dice.Roll(5, 6, 1)
+    )
+    assert dice.distribution.cache_info().currsize == 4
+    assert dict(dice.roll(3)) == {3: fractions.Fraction(1, 1)}
+    assert dice.variance(dice.Roll(2, 6)) == fractions.Fraction(35, 6)
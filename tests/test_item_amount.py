@@ -0,0 +1,10 @@
+from warhammer import item_amount
+
+
+def test_split():
+    # type: () -> None
+    items = item_amount.ItemAmount({"a": 2, "b": 3, "c": 1})
+    head, tail = items.split(3)
+    assert list(head.iter_all()) == list(items.iter_all())[:3]
+    assert list(tail.iter_all()) == list(items.iter_all())[3:]
+    assert (head.total(), tail.total()) == (3, 3)
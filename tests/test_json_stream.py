@@ -0,0 +1,51 @@
+import io
+import json
+import os
+
+import pytest
+
+from warhammer import stores
+from warhammer._io import json_stream
+
+DOCUMENTS = [
+    "[]",
+    "[-1.5e3]",
+    " [ 1 , 22,333 ] ",
+    '[{"name": "a]b", "x": [1, {"y": "},"}]}, "\\"[", null, true, -1.5e3]',
+]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, json_stream.CHUNK_SIZE])
+def test_iter_array(document, chunk_size):
+    # type: (str, int) -> None
+    items = json_stream.iter_array(io.StringIO(document), chunk_size)
+    assert list(items) == json.loads(document)
+
+
+@pytest.mark.parametrize("document", ["", "[1, 2", "[1 2]", "{}"])
+def test_iter_array_invalid(document):
+    # type: (str) -> None
+    with pytest.raises(ValueError):
+        list(json_stream.iter_array(io.StringIO(document), 2))
+
+
+def test_lines(tmp_path):
+    # type: (...) -> None
+    path = tmp_path / "weapons.jsonl"
+    records = json.loads(DOCUMENTS[2])
+    json_stream.write(path, records)
+    assert json_stream.path(tmp_path, "weapons") == path
+    assert json_stream.read(path) == list(json_stream.iter_records(path)) == records
+    umask = os.umask(0o022)
+    os.umask(umask)
+    assert path.stat().st_mode & 0o777 == 0o666 & ~umask
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_stream():
+    # type: () -> None
+    streamed = stores("chaos.csm", stream=True)
+    lazy = stores("chaos.csm")
+    assert str(streamed.models["Havoc"]) == str(lazy.models["Havoc"])
+    assert list(streamed.weapons._data) == list(lazy.weapons._data)
@@ -0,0 +1,24 @@
+import dataclasses
+import pickle
+
+import pytest
+
+from warhammer import models, unit
+
+
+def test_slotted(boltgun):
+    # type: (...) -> None
+    assert not hasattr(boltgun, "__dict__")
+    assert hash(boltgun) == hash(dataclasses.replace(boltgun))
+    assert pickle.loads(pickle.dumps(boltgun)) == boltgun
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        boltgun.strength = 5
+
+
+def test_intern(marine):
+    # type: (...) -> None
+    first = unit.Unit.from_item(marine)()
+    second = unit.Unit.from_item(marine)()
+    assert list(first.iter_unique())[0] is list(second.iter_unique())[0]
+    effects = (models.Effect("Aura", models.EffectType.OFFENCIVE),)
+    assert models.intern_effects(tuple(list(effects))) is models.intern_effects(effects)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import Union
+
+from warhammer_old.object import builder
+from warhammer_old.object_loader import model
+from warhammer_old.objects import values
+
+
+@dataclasses.dataclass(frozen=True)
+class Leaf:
+    name: str
+
+
+@dataclasses.dataclass(frozen=True)
+class Node:
+    value: Union[int, str, Leaf, Node]
+
+
+def test_load():
+    # type: () -> None
+    record = {
+        "_model": "Combination",
+        "lhs": {"_model": "Relative", "stat": "strength"},
+        "rhs": {
+            "_model": "Combination",
+            "lhs": {"_model": "Constant", "value": 6},
+            "rhs": {"_model": "Dice", "amount": 2, "range": 3},
+            "operator": "-",
+        },
+        "operator": "+",
+    }
+    assert builder.load(record) == values.Combination(
+        values.Relative("strength"),
+        values.Combination(values.Constant(6), values.Dice(2, 3), values.Operators.SUB),
+        values.Operators.ADD,
+    )
+    assert record["_model"] == "Combination"
+
+
+def test_union():
+    # type: () -> None
+    models = model.Models([Leaf, Node])
+    leaf = {"_model": "Leaf", "name": "a"}
+    assert models.load({"_model": "Node", "value": 1}) == Node(1)
+    assert models.load({"_model": "Node", "value": "a"}) == Node("a")
+    assert models.load({"_model": "Node", "value": leaf}) == Node(Leaf("a"))
+    nested = {"_model": "Node", "value": {"_model": "Node", "value": leaf}}
+    assert models.load(nested) == Node(Node(Leaf("a")))
@@ -0,0 +1,103 @@
+import dataclasses
+import json
+
+from warhammer import WarhammerData
+from warhammer._io import store
+
+
+def loaded(store_):
+    # type: (store.Store) -> list
+    return [
+        name for name, value in store_._data.items() if value is not store._UNLOADED
+    ]
+
+
+def test_lazy():
+    # type: () -> None
+    store.clear_cache()
+    csm = WarhammerData("chaos.csm")
+    assert loaded(csm.stores.models) == loaded(csm.stores.weapons) == []
+    csm.model.Havoc(csm.weapon.Boltgun)
+    assert loaded(csm.stores.models) == ["Havoc"]
+    assert loaded(csm.stores.weapons) == ["Boltgun"]
+    assert csm.effect.HiddenInPlainSight is csm.effect.HiddenInPlainSight
+
+
+def test_cached_stores(codex_dir):
+    # type: (...) -> None
+    store.clear_cache()
+    first = WarhammerData("chaos.csm").stores
+    other = WarhammerData("chaos.csm").stores
+    assert other is not first and other.weapons._records is first.weapons._records
+    other.weapons["Boltgun"]
+    assert loaded(first.weapons) == []
+    path = codex_dir / "weapons.json"
+    path.write_text(path.read_text().replace('"strength": 4', '"strength": 5'))
+    second = WarhammerData("chaos.csm").stores
+    assert second.weapons._records is not first.weapons._records
+    assert second.weapons["Boltgun"].strength == 5
+    store.clear_cache()
+
+
+def test_effect_alias(codex_dir):
+    # type: (...) -> None
+    path = codex_dir / "effects.json"
+    path.write_text(
+        json.dumps(
+            [
+                {"base": "HiddenInPlainSight", "name": "HiddenBetter", "type": None},
+                {"base": "Effect", "name": "HiddenInPlainSight", "type": "OFFENCIVE"},
+            ]
+        )
+    )
+    effects = store.stores("chaos.csm").effects
+    better = effects.get_effect("HiddenBetter")
+    assert better.func is effects.get_effect("HiddenInPlainSight")
+    assert loaded(effects) == ["HiddenBetter", "HiddenInPlainSight"]
+
+
+def test_save(codex_dir):
+    # type: (...) -> None
+    stores = store.stores("chaos.csm")
+    stores.models["Havoc"]
+    assert not stores.models.dirty
+    stores.weapons["Boltgun"] = dataclasses.replace(
+        stores.weapons["Boltgun"], strength=5
+    )
+    del stores.weapons["Lascannon"]
+    assert stores.weapons.dirty
+    before = {path.name: path.stat().st_mtime_ns for path in stores_paths(stores)}
+    stores.save()
+    after = {path.name: path.stat().st_mtime_ns for path in stores_paths(stores)}
+    assert [name for name in before if before[name] != after[name]] == ["weapons.json"]
+    assert not stores.weapons.dirty
+    saved = store.stores("chaos.csm").weapons
+    assert list(saved._data) == ["Boltgun", "Chainsword"]
+    assert saved["Boltgun"].strength == 5
+    assert list(codex_dir.glob(".*")) == []
+
+
+def stores_paths(stores):
+    # type: (store.StoreCollection) -> list
+    return [stores.effects.path, stores.models.path, stores.weapons.path]
+
+
+def test_search():
+    # type: () -> None
+    stores = store.stores("chaos.csm")
+    assert stores.models.index.prefix("hav") == ["Havoc", "HavocChampion"]
+    assert stores.models.index.get("chaoslord") == "ChaosLord"
+    assert stores.search("boltgn")["weapons"] == ["Boltgun"]
+    assert stores.weapons.index.query(strength=(2, None)) == ["Boltgun"]
+    weak = stores.weapons.index.query(strength=(None, 1), armour_penetration=(1, 1))
+    assert weak == ["Chainsword", "Lascannon"]
+    assert loaded(stores.weapons) == []
+    stores.weapons["Boltgun"] = dataclasses.replace(
+        stores.weapons["Boltgun"], strength=1
+    )
+    assert stores.weapons.index.query(strength=(2, None)) == []
+    melee = stores.weapons.index.query(type=("MELEE", "MELEE"))
+    assert melee == ["Boltgun", "Chainsword", "Lascannon"]
+    csm = WarhammerData("chaos.csm")
+    assert str(csm.model.havoc) == str(csm.model.Havoc)
+    assert csm.effect.hiddeninplainsight is csm.effect.HiddenInPlainSight
@@ -0,0 +1,25 @@
+import fractions
+
+from warhammer import tables
+
+
+def test_tables():
+    # type: () -> None
+    assert tables.wound_skill(8, 4) == tables.wound_skill(30, 15) == 2
+    assert tables.wound_skill(4, 5) == tables.wound_skill(24, 30) == 5
+    assert tables.save(3, -1, 7) == 4
+    assert tables.save(3, -5, 5) == 5
+    assert tables.save(6, 0, 4) == 4
+    assert tables.save(30, 0, 7) == 7
+    assert tables.unsaved_chance(4, -2, 5) == fractions.Fraction(4, 6)
+    assert tables.hit_chance(3) == tables.HIT[3] == fractions.Fraction(2, 3)
+    for strength in range(-1, tables.LIMIT + 2):
+        for toughness in range(-1, tables.LIMIT + 2):
+            skill = tables._wound_skill(strength, toughness)
+            assert tables.wound_skill(strength, toughness) == skill
+            assert tables.wound_chance(strength, toughness) * 6 == 7 - skill
+    for armour_penetration in range(-tables.LIMIT - 1, tables.LIMIT + 2):
+        skill = tables._save(3, armour_penetration, 5)
+        assert tables.save(3, armour_penetration, 5) == skill
+        assert tables.unsaved_chance(3, armour_penetration, 5) * 6 == skill - 1
+    assert tables._in_save_table(3, -1, 7)
@@ -0,0 +1,59 @@
+import dataclasses
+
+from warhammer import attacks, dice, models, sweep, unit
+
+
+def test_expected(marine):
+    # type: (...) -> None
+    marines = 5 * unit.Unit.from_item(marine)()
+    exact = marines.attack(marines).sanitize().summary()
+    fast = marines.weapons().expected(marines).sanitize().summary()
+    assert fast == exact
+
+
+def test_weapon_attacks(boltgun, marine):
+    # type: (...) -> None
+    single = dataclasses.replace(boltgun, name="Single", attacks=1)
+    one = unit.Unit.from_item(
+        dataclasses.replace(marine, weapons=models.WeaponAmount.from_item(single))
+    )()
+    damage = one.attack(one).sanitize().damages()[0]
+    marines = unit.Unit.from_item(marine)()
+    assert marines.attack(marines).sanitize().damages() == [damage + damage]
+
+
+def test_sweep(marine):
+    # type: (...) -> None
+    marines = unit.Unit.from_item(marine)()
+    attackers = {"one": marines, "five": 5 * marines}
+    rows = sweep.sweep(attackers, {"marines": marines}, [0, 30], expected=True)
+    assert [(row.attacker, row.distance) for row in rows] == [
+        ("one", 0),
+        ("one", 30),
+        ("five", 0),
+        ("five", 30),
+    ]
+    assert rows[2].result == 5 * rows[0].result
+    assert rows[1].result == rows[3].result == attacks.Summary(0, 0)
+
+
+def test_sweep_out_of_range(marine):
+    # type: (...) -> None
+    marines = unit.Unit.from_item(marine)()
+    rows = sweep.sweep({"one": marines}, {"marines": marines}, [0, 30])
+    assert rows[1].result == attacks.NOTHING
+    assert attacks.Summary.from_damage(rows[1].result) == attacks.Summary(0, 0)
+    assert rows[0].result != rows[1].result
+
+
+def test_dice(boltgun, marine):
+    # type: (...) -> None
+    shotgun = dataclasses.replace(
+        boltgun, name="Shotgun", attacks=dice.Roll(2, 6), damage=dice.Roll(1, 3)
+    )
+    marine = dataclasses.replace(marine, weapons=models.WeaponAmount.from_item(shotgun))
+    marines = 2 * unit.Unit.from_item(marine)()
+    damage = marines.attack(marines).sanitize().damages()[0]
+    assert max(damage.keys()) == 2 * 12 * 3
+    exact = attacks.Summary.from_damage(damage)
+    assert marines.weapons().expected(marines).sanitize().summary() == [exact]
@@ -0,0 +1,42 @@
+import collections
+import itertools
+import types
+
+from warhammer_old.objects import values
+
+PARENT = types.SimpleNamespace(strength=values.Constant(4))
+
+
+def test_sub():
+    # type: () -> None
+    value = values.Combination(
+        values.Constant(6), values.Dice(1, 3), values.Operators.SUB
+    )
+    assert dict(value.histogram(PARENT)) == {5: 1, 4: 1, 3: 1}
+    relative = values.Combination(
+        values.Relative("strength"), values.Constant(1), values.Operators.SUB
+    )
+    assert list(relative.values(PARENT)) == [3]
+
+
+def test_values():
+    # type: () -> None
+    value = values.Combination(
+        values.Combination(values.Dice(2, 6), values.Dice(1, 3), values.Operators.SUB),
+        values.Relative("strength"),
+        values.Operators.ADD,
+    )
+    expected = [
+        a + b - c + 4
+        for a, b, c in itertools.product(range(1, 7), range(1, 7), range(1, 4))
+    ]
+    assert sorted(value.values(PARENT)) == sorted(expected)
+    assert dict(value.histogram(PARENT)) == collections.Counter(expected)
+
+
+def test_large():
+    # type: () -> None
+    histogram = values.Dice(20, 6).histogram(PARENT)
+    assert len(histogram) == 101
+    assert sum(histogram.values()) == 6 ** 20
+    assert next(iter(values.Dice(20, 6).values(PARENT))) == 20
@@ -0,0 +1,105 @@
+import dataclasses
+
+import pytest
+
+from warhammer import attacks, models, unit_attack
+
+np = pytest.importorskip("numpy")
+from warhammer import vector  # isort:skip
+
+PROFILES = [
+    models.Attack(3, 1, 0, 1, 4, 4, 1, 3, 7, 7),
+    models.Attack(2, 1, -1, 3, 8, 4, 5, 4, 5, 5),
+    models.Attack(4, 1, -3, 6, 3, 7, 12, 2, 4, 6),
+]
+
+
+def assert_close(approx, exact):
+    for damage in set(approx) | set(exact):
+        assert approx.get(damage, 0.0) == pytest.approx(float(exact.get(damage, 0)))
+
+
+@pytest.mark.parametrize("profile", PROFILES)
+def test_attack(profile):
+    # type: (models.Attack) -> None
+    assert_close(vector.Attack(()).attack(profile), attacks.Attack(()).attack(profile))
+
+
+def test_add():
+    # type: () -> None
+    exact = [attacks.Attack(()).attack(profile) for profile in PROFILES]
+    approx = [vector.Attack(()).attack(profile) for profile in PROFILES]
+    assert_close(sum(approx[1:], approx[0]), sum(exact[1:], exact[0]))
+
+
+def test_batch():
+    # type: () -> None
+    attackers = vector.Attackers(
+        *vector.np.array(
+            [
+                (p.attack_skill, p.armour_penetration, p.damage, p.strength)
+                for p in PROFILES
+            ]
+        ).T
+    )
+    targets = vector.Targets(
+        *vector.np.array(
+            [(p.toughness, p.save, p.invulnerable, p.feel_no_pain) for p in PROFILES]
+        ).T
+    )
+    grid = vector.damages(attackers, targets)
+    means = vector.expected(attackers, targets)
+    assert grid.shape[:2] == means.shape == (len(PROFILES), len(PROFILES))
+    for i, attacker in enumerate(PROFILES):
+        for j, target in enumerate(PROFILES):
+            profile = dataclasses.replace(
+                target,
+                attack_skill=attacker.attack_skill,
+                armour_penetration=attacker.armour_penetration,
+                damage=attacker.damage,
+                strength=attacker.strength,
+            )
+            damage = vector.Attack(()).attack(profile)
+            assert_close(vector.Damage(grid[i, j]), damage)
+            assert means[i, j] == pytest.approx(damage.mean())
+
+
+def test_from_models(boltgun, marine):
+    # type: (...) -> None
+    offencive = models.EffectType.OFFENCIVE
+    reroll = models.Reroll("RerollOnes", offencive, stage=models.Stage.HIT)
+    sixes = models.MortalWounds("Mortal", offencive, value=2)
+    cover = models.Modifier(
+        "Cover", models.EffectType.DEFENSIVE, stage=models.Stage.SAVE, value=1
+    )
+    lascannon = dataclasses.replace(
+        boltgun, name="Lascannon", armour_penetration=-3, damage=3, effects=(sixes,)
+    )
+    sergeant = dataclasses.replace(marine, name="Sergeant", effects=(reroll,))
+    covered = dataclasses.replace(marine, name="Covered", effects=(cover,))
+    profiles = [(marine, boltgun), (sergeant, boltgun), (marine, lascannon)]
+    targets = [marine, covered]
+    attackers_ = vector.Attackers.from_models(profiles)
+    targets_ = vector.Targets.from_models(targets)
+    grid = vector.damages(attackers_, targets_)
+    means = vector.expected(attackers_, targets_)
+    for i, (model, weapon) in enumerate(profiles):
+        for j, target in enumerate(targets):
+            effects = unit_attack.extract_effects(model, weapon, target, [], 0)
+            exact = attacks.Attack(effects).attack(
+                models.Attack.from_models(model, weapon, target)
+            )
+            assert_close(vector.Damage(grid[i, j]), exact)
+            mean = attacks.Summary.from_damage(exact).mean
+            assert means[i, j] == pytest.approx(float(mean))
+
+
+def test_tables():
+    # type: () -> None
+    strength = np.arange(1, 31)[:, None]
+    toughness = np.arange(1, 31)[None, :]
+    assert (
+        vector.wound_skill(strength[:20], toughness[:, :20])
+        == vector.wound_skill(strength, toughness)[:20, :20]
+    ).all()
+    assert vector.UNSAVED.shape == (21, 41, 21)
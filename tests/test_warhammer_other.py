@@ -0,0 +1,62 @@
+import collections
+import fractions
+
+import pytest
+
+pytest.importorskip("matplotlib")
+pytest.importorskip("pandas")
+from warhammer_other import warhammer as w  # isort:skip
+
+PHASES = [
+    (
+        [w.phase(w.Score(2), w.Reroll(1)), w.phase(w.Score(4)), w.phase(w.Score(4))],
+        [w.Damage(2)],
+    ),
+    (
+        [w.phase(w.Score(3), w.Reroll(1)), w.phase(w.Score(3)), w.phase(w.Score(5))],
+        [w.Dice()],
+    ),
+    (
+        [
+            w.phase(w.Score(2), w.Reroll(1), w.Modifier(1), w.BonusAttack(6)),
+            w.phase(w.Score(3), w.Reroll(1), w.Modifier(1), w.MortalWound(7)),
+            w.phase(w.Score(3), w.Modifier(-3)),
+        ],
+        [w.Dice(amount=2), w.Damage(1)],
+    ),
+]
+
+
+def reference(one, attacks):
+    """Damage of ``attacks`` rolls of ``one``, convolved a roll at a time."""
+    totals = {0: fractions.Fraction(1)}
+    for _ in range(attacks):
+        new_totals = collections.defaultdict(int)
+        for total, chance in totals.items():
+            for damage, damage_chance in one.items():
+                new_totals[total + damage] += chance * damage_chance
+        totals = new_totals
+    # Every hit does damage, so no damage means every attack missed.
+    totals.pop(0)
+    return dict(totals)
+
+
+@pytest.mark.parametrize("phases, damage", PHASES)
+def test_pipeline(phases, damage):
+    # type: (list, list) -> None
+    pipeline = w.Pipeline(*phases, w.damage(w.Attacks(4), *damage))
+    one = dict(pipeline.damage(1))
+    one[0] = 1 - sum(one.values())
+    for attacks in (4, 1, 7, 3):
+        assert dict(pipeline.damage(attacks)) == reference(one, attacks)
+    assert w.Pipeline(*phases, w.damage(w.Attacks(4), *damage))() == pipeline()
+
+
+def test_binomial():
+    # type: () -> None
+    phases, _ = PHASES[0]
+    pipeline = w.Pipeline(*phases, w.damage(w.Attacks(151), w.Damage(1)))
+    one = dict(pipeline.damage(1))
+    one[0] = 1 - sum(one.values())
+    assert dict(pipeline.damage(151)) == reference(one, 151)
+    assert w.binomial(151, 75) == w.binomial(150, 74) + w.binomial(150, 75)
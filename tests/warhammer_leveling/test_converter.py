@@ -0,0 +1,69 @@
+import dataclasses
+from typing import Optional
+
+import pytest
+
+pytest.importorskip("dataclasses_json")
+from warhammer_leveling import loader  # isort:skip
+from warhammer_leveling.converters import converter  # isort:skip
+
+RECORD = {
+    "name": "Bike",
+    "requirements": {"rank": 1, "upgrades": ["!ANY", "~Champion"]},
+    "bonus": "14 ... +1 +1 ........",
+    "equipment": {"this": [], "merge": {"Bolter": ["Bike Bolter"]}},
+    "abilities": ["6Adv"],
+    "keywords": ["-INFANTRY", "+BIKER"],
+}
+
+
+@dataclasses.dataclass
+class Inner:
+    value: int
+
+
+@dataclasses.dataclass
+class Outer:
+    inner: Inner
+
+
+@dataclasses.dataclass
+class MaybeOuter:
+    inner: Optional[Inner]
+
+
+class ExtOuter(converter.Converter[Outer]):
+    value = converter.Converters.property("inner.value")
+
+
+class ExtOptional(converter.Converter[MaybeOuter]):
+    value = converter.Converters.property("inner.value")
+
+
+def test_build():
+    # type: () -> None
+    upgrade = loader.ExtUpgrade.schema().load(RECORD).build()
+    assert upgrade == loader.Upgrade(
+        "Bike",
+        loader.Requirements(1, ["!ANY", "~Champion"]),
+        loader.Bonus.from_str("14 ... +1 +1 ........"),
+        loader.Equipment([], {"Bolter": ["Bike Bolter"]}),
+        ["6Adv"],
+        ["-INFANTRY", "+BIKER"],
+    )
+
+
+def test_plan():
+    # type: () -> None
+    converter._plan.cache_clear()
+    assert ExtOuter(value=1).build() == Outer(Inner(1))
+    misses = converter._plan.cache_info().misses
+    assert misses == 2
+    assert ExtOuter(value=2).build() == Outer(Inner(2))
+    assert converter._plan.cache_info().misses == misses
+
+
+def test_not_a_class():
+    # type: () -> None
+    with pytest.raises(TypeError, match="isn't a class"):
+        ExtOptional(value=1).build()